@@ -0,0 +1,63 @@
+package dialect
+
+import (
+	"context"
+	"database/sql"
+	"database/sql/driver"
+	"fmt"
+)
+
+// OpenDB opens a connection pool for the dialect's driver in which every new
+// connection runs the dialect's setup statements before it is handed out.
+// Session settings such as session_replication_role then hold for the whole
+// pool, including connections re-established after a network failure.
+func OpenDB(d Dialect, dsn string) (*sql.DB, error) {
+	db, err := sql.Open(d.GetDriverName(), dsn)
+	if err != nil {
+		return nil, err
+	}
+	drv, ok := db.Driver().(driver.DriverContext)
+	db.Close()
+	if !ok {
+		return nil, fmt.Errorf("driver %s does not support connectors", d.GetDriverName())
+	}
+
+	connector, err := drv.OpenConnector(dsn)
+	if err != nil {
+		return nil, err
+	}
+	return sql.OpenDB(newSetupConnector(connector, d.SetupStatements())), nil
+}
+
+// setupConnector wraps a driver.Connector to run setup statements on each new connection
+type setupConnector struct {
+	driver.Connector
+	statements []string
+}
+
+func newSetupConnector(connector driver.Connector, statements []string) *setupConnector {
+	return &setupConnector{Connector: connector, statements: statements}
+}
+
+func (c *setupConnector) Connect(ctx context.Context) (driver.Conn, error) {
+	conn, err := c.Connector.Connect(ctx)
+	if err != nil {
+		return nil, err
+	}
+	if len(c.statements) == 0 {
+		return conn, nil
+	}
+
+	execer, ok := conn.(driver.ExecerContext)
+	if !ok {
+		conn.Close()
+		return nil, fmt.Errorf("driver connection does not support ExecContext")
+	}
+	for _, stmt := range c.statements {
+		if _, err := execer.ExecContext(ctx, stmt, nil); err != nil {
+			conn.Close()
+			return nil, fmt.Errorf("failed to run setup statement %q: %w", stmt, err)
+		}
+	}
+	return conn, nil
+}
@@ -0,0 +1,93 @@
+package dialect
+
+import (
+	"context"
+	"database/sql/driver"
+	"errors"
+	"reflect"
+	"testing"
+)
+
+type fakeConn struct {
+	executed []string
+	failOn   string
+	closed   bool
+}
+
+func (c *fakeConn) Prepare(query string) (driver.Stmt, error) {
+	return nil, errors.New("not implemented")
+}
+
+func (c *fakeConn) Close() error {
+	c.closed = true
+	return nil
+}
+
+func (c *fakeConn) Begin() (driver.Tx, error) {
+	return nil, errors.New("not implemented")
+}
+
+func (c *fakeConn) ExecContext(ctx context.Context, query string, args []driver.NamedValue) (driver.Result, error) {
+	if query == c.failOn {
+		return nil, errors.New("setup failed")
+	}
+	c.executed = append(c.executed, query)
+	return driver.RowsAffected(0), nil
+}
+
+type fakeConnector struct {
+	conns []*fakeConn
+	conn  func() *fakeConn
+}
+
+func (c *fakeConnector) Connect(ctx context.Context) (driver.Conn, error) {
+	conn := c.conn()
+	c.conns = append(c.conns, conn)
+	return conn, nil
+}
+
+func (c *fakeConnector) Driver() driver.Driver {
+	return nil
+}
+
+func TestSetupConnector_RunsStatementsOnEveryConnection(t *testing.T) {
+	inner := &fakeConnector{conn: func() *fakeConn { return &fakeConn{} }}
+	statements := []string{"SET session_replication_role = 'replica'"}
+	c := newSetupConnector(inner, statements)
+
+	for i := 0; i < 2; i++ {
+		if _, err := c.Connect(context.Background()); err != nil {
+			t.Fatalf("Connect() error = %v", err)
+		}
+	}
+
+	if len(inner.conns) != 2 {
+		t.Fatalf("expected 2 connections, got %d", len(inner.conns))
+	}
+	for i, conn := range inner.conns {
+		if !reflect.DeepEqual(conn.executed, statements) {
+			t.Errorf("connection %d executed %v, want %v", i, conn.executed, statements)
+		}
+	}
+}
+
+func TestSetupConnector_ClosesConnectionOnSetupFailure(t *testing.T) {
+	inner := &fakeConnector{conn: func() *fakeConn { return &fakeConn{failOn: "SET FOREIGN_KEY_CHECKS = 0"} }}
+	c := newSetupConnector(inner, []string{"SET FOREIGN_KEY_CHECKS = 0"})
+
+	if _, err := c.Connect(context.Background()); err == nil {
+		t.Fatal("Connect() expected error when a setup statement fails")
+	}
+	if !inner.conns[0].closed {
+		t.Error("connection should be closed when setup fails")
+	}
+}
+
+func TestSetupStatements(t *testing.T) {
+	if got := NewPostgreSQL().SetupStatements(); !reflect.DeepEqual(got, []string{"SET session_replication_role = 'replica'"}) {
+		t.Errorf("PostgreSQL SetupStatements() = %v", got)
+	}
+	if got := NewMySQL().SetupStatements(); !reflect.DeepEqual(got, []string{"SET FOREIGN_KEY_CHECKS = 0"}) {
+		t.Errorf("MySQL SetupStatements() = %v", got)
+	}
+}
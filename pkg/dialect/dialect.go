@@ -3,6 +3,7 @@ package dialect
 import (
 	"context"
 	"database/sql"
+	"sync"
 	"time"
 
 	"kasho/proto"
@@ -19,13 +20,17 @@ type Dialect interface {
 	// QuoteIdentifier quotes a table or column name
 	QuoteIdentifier(name string) string
 
-	// SetupConnection runs any necessary setup commands on a new connection
+	// SetupStatements returns the session setup commands OpenDB runs on every connection
 	// e.g., PostgreSQL: SET session_replication_role = 'replica'
 	// e.g., MySQL: SET FOREIGN_KEY_CHECKS = 0
-	SetupConnection(db *sql.DB) error
+	SetupStatements() []string
 
-	// SyncSequences synchronizes auto-increment/sequence values
-	SyncSequences(ctx context.Context, db *sql.DB) error
+	// LoadSequences returns every sequence or auto-increment column in the database
+	LoadSequences(ctx context.Context, db *sql.DB) ([]Sequence, error)
+
+	// SyncSequences sets the given sequences/auto-increment values past the
+	// highest value in the column each one feeds
+	SyncSequences(ctx context.Context, db *sql.DB, sequences []Sequence) error
 
 	// GetUserTablesQuery returns SQL to count user tables
 	GetUserTablesQuery() string
@@ -36,6 +41,12 @@ type Dialect interface {
 	// FormatDSN converts a URL-style connection string to the driver's native DSN format
 	FormatDSN(connStr string) string
 
+	// EnableMultiStatements returns a DSN that allows several semicolon-separated
+	// statements to be sent in a single Exec call
+	// e.g., PostgreSQL: supported natively by the simple query protocol
+	// e.g., MySQL: requires multiStatements=true
+	EnableMultiStatements(dsn string) string
+
 	// Native type formatting methods (proto-free)
 	// These can be used by tools that don't need protobuf dependencies
 
@@ -80,3 +91,92 @@ type Dialect interface {
 	// TypeInteger returns the column type for integers
 	TypeInteger() string
 }
+
+// Sequence is a sequence (PostgreSQL) or auto-increment column (MySQL) that
+// generates values for a table column
+type Sequence struct {
+	Schema string
+	Table  string
+	Column string
+	Name   string // sequence name; empty for MySQL auto_increment
+}
+
+// SequenceCatalog caches the database's sequences by table, so syncing after
+// inserts needs no catalog query until the schema changes
+type SequenceCatalog struct {
+	dialect    Dialect
+	mu         sync.Mutex
+	byTable    map[string][]Sequence // nil until loaded, and again after Invalidate
+	generation uint64                // bumped by Invalidate
+}
+
+// NewSequenceCatalog creates a catalog that is loaded on first use
+func NewSequenceCatalog(d Dialect) *SequenceCatalog {
+	return &SequenceCatalog{dialect: d}
+}
+
+// Invalidate marks the catalog stale, e.g. after DDL, so the next Sync reloads it
+func (c *SequenceCatalog) Invalidate() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	c.byTable = nil
+	c.generation++
+}
+
+// Sync synchronizes the sequences owned by the given tables, named "schema.table"
+// or "table". Tables without a sequence are skipped without touching the database.
+// The lock is only held to read or swap the cache, never across a database call,
+// so Invalidate does not wait for a sync in progress.
+func (c *SequenceCatalog) Sync(ctx context.Context, db *sql.DB, tables []string) error {
+	c.mu.Lock()
+	byTable, generation := c.byTable, c.generation
+	c.mu.Unlock()
+
+	if byTable == nil {
+		sequences, err := c.dialect.LoadSequences(ctx, db)
+		if err != nil {
+			return err
+		}
+		byTable = indexSequences(sequences)
+
+		// Only cache the result if the schema did not change while loading
+		c.mu.Lock()
+		if c.generation == generation {
+			c.byTable = byTable
+		}
+		c.mu.Unlock()
+	}
+
+	sequences := lookupSequences(byTable, tables)
+	if len(sequences) == 0 {
+		return nil
+	}
+	return c.dialect.SyncSequences(ctx, db, sequences)
+}
+
+// indexSequences keys sequences by both "schema.table" and bare "table"
+func indexSequences(sequences []Sequence) map[string][]Sequence {
+	byTable := make(map[string][]Sequence, len(sequences))
+	for _, seq := range sequences {
+		qualified := seq.Schema + "." + seq.Table
+		byTable[qualified] = append(byTable[qualified], seq)
+		byTable[seq.Table] = append(byTable[seq.Table], seq)
+	}
+	return byTable
+}
+
+// lookupSequences returns the sequences for the given tables, each at most once
+func lookupSequences(byTable map[string][]Sequence, tables []string) []Sequence {
+	var sequences []Sequence
+	seen := make(map[Sequence]struct{})
+	for _, table := range tables {
+		for _, seq := range byTable[table] {
+			if _, ok := seen[seq]; ok {
+				continue
+			}
+			seen[seq] = struct{}{}
+			sequences = append(sequences, seq)
+		}
+	}
+	return sequences
+}
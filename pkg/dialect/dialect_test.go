@@ -0,0 +1,47 @@
+package dialect
+
+import (
+	"reflect"
+	"testing"
+)
+
+func TestLookupSequences(t *testing.T) {
+	usersID := Sequence{Schema: "public", Table: "users", Column: "id", Name: "users_id_seq"}
+	auditID := Sequence{Schema: "audit", Table: "users", Column: "id", Name: "users_id_seq"}
+	ordersID := Sequence{Schema: "public", Table: "orders", Column: "id", Name: "orders_id_seq"}
+
+	byTable := indexSequences([]Sequence{usersID, auditID, ordersID})
+
+	tests := []struct {
+		name   string
+		tables []string
+		want   []Sequence
+	}{
+		{"no tables", nil, nil},
+		{"qualified name", []string{"public.users"}, []Sequence{usersID}},
+		{"bare name matches every schema", []string{"users"}, []Sequence{usersID, auditID}},
+		{"same table named twice", []string{"public.orders", "orders"}, []Sequence{ordersID}},
+		{"table without a sequence", []string{"public.sessions"}, nil},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := lookupSequences(byTable, tt.tables); !reflect.DeepEqual(got, tt.want) {
+				t.Errorf("lookupSequences(%v) = %v, want %v", tt.tables, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestSequenceCatalog_Invalidate(t *testing.T) {
+	c := NewSequenceCatalog(NewPostgreSQL())
+	c.byTable = indexSequences(nil)
+
+	c.Invalidate()
+	if c.byTable != nil {
+		t.Error("Invalidate() should drop the cached catalog")
+	}
+	if c.generation != 1 {
+		t.Errorf("generation = %d, want 1", c.generation)
+	}
+}
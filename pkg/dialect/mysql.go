@@ -57,15 +57,13 @@ func (m *MySQL) QuoteIdentifier(name string) string {
 	return fmt.Sprintf("`%s`", strings.ReplaceAll(name, "`", "``"))
 }
 
-func (m *MySQL) SetupConnection(db *sql.DB) error {
+func (m *MySQL) SetupStatements() []string {
 	// Disable foreign key checks to allow replication without order dependencies
-	_, err := db.Exec("SET FOREIGN_KEY_CHECKS = 0")
-	return err
+	return []string{"SET FOREIGN_KEY_CHECKS = 0"}
 }
 
-func (m *MySQL) SyncSequences(ctx context.Context, db *sql.DB) error {
+func (m *MySQL) LoadSequences(ctx context.Context, db *sql.DB) ([]Sequence, error) {
 	// MySQL uses AUTO_INCREMENT which is managed per-table
-	// Query to find tables with auto_increment columns and sync their values
 	query := `
 		SELECT
 			t.TABLE_SCHEMA,
@@ -81,16 +79,25 @@ func (m *MySQL) SyncSequences(ctx context.Context, db *sql.DB) error {
 
 	rows, err := db.QueryContext(ctx, query)
 	if err != nil {
-		return fmt.Errorf("failed to query auto_increment columns: %w", err)
+		return nil, fmt.Errorf("failed to query auto_increment columns: %w", err)
 	}
 	defer rows.Close()
 
-	updatedCount := 0
+	var sequences []Sequence
 	for rows.Next() {
-		var schema, table, column string
-		if err := rows.Scan(&schema, &table, &column); err != nil {
-			return fmt.Errorf("failed to scan auto_increment info: %w", err)
+		var seq Sequence
+		if err := rows.Scan(&seq.Schema, &seq.Table, &seq.Column); err != nil {
+			return nil, fmt.Errorf("failed to scan auto_increment info: %w", err)
 		}
+		sequences = append(sequences, seq)
+	}
+	return sequences, rows.Err()
+}
+
+func (m *MySQL) SyncSequences(ctx context.Context, db *sql.DB, sequences []Sequence) error {
+	updatedCount := 0
+	for _, seq := range sequences {
+		schema, table, column := seq.Schema, seq.Table, seq.Column
 
 		// Get max value for the column
 		var maxVal sql.NullInt64
@@ -113,10 +120,6 @@ func (m *MySQL) SyncSequences(ctx context.Context, db *sql.DB) error {
 		updatedCount++
 	}
 
-	if err := rows.Err(); err != nil {
-		return err
-	}
-
 	log.Printf("Updated %d auto_increment values", updatedCount)
 	return nil
 }
@@ -172,6 +175,16 @@ func (m *MySQL) FormatDSN(connStr string) string {
 	return dsn.String()
 }
 
+func (m *MySQL) EnableMultiStatements(dsn string) string {
+	if strings.Contains(dsn, "multiStatements=") {
+		return dsn
+	}
+	if strings.Contains(dsn, "?") {
+		return dsn + "&multiStatements=true"
+	}
+	return dsn + "?multiStatements=true"
+}
+
 // Native type formatting methods
 
 func (m *MySQL) FormatString(s string) string {
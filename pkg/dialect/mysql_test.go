@@ -334,6 +334,41 @@ func TestMySQL_FormatDSN(t *testing.T) {
 	}
 }
 
+func TestMySQL_EnableMultiStatements(t *testing.T) {
+	d := NewMySQL()
+
+	tests := []struct {
+		name     string
+		dsn      string
+		expected string
+	}{
+		{
+			name:     "DSN without query parameters",
+			dsn:      "user:password@tcp(localhost:3306)/mydb",
+			expected: "user:password@tcp(localhost:3306)/mydb?multiStatements=true",
+		},
+		{
+			name:     "DSN with query parameters",
+			dsn:      "user:password@tcp(localhost:3306)/mydb?parseTime=true",
+			expected: "user:password@tcp(localhost:3306)/mydb?parseTime=true&multiStatements=true",
+		},
+		{
+			name:     "DSN already setting multiStatements",
+			dsn:      "user:password@tcp(localhost:3306)/mydb?multiStatements=false",
+			expected: "user:password@tcp(localhost:3306)/mydb?multiStatements=false",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got := d.EnableMultiStatements(tt.dsn)
+			if got != tt.expected {
+				t.Errorf("EnableMultiStatements(%q) = %q, want %q", tt.dsn, got, tt.expected)
+			}
+		})
+	}
+}
+
 // Tests for native type formatting methods
 
 func TestMySQL_FormatString(t *testing.T) {
@@ -65,12 +65,11 @@ func (p *PostgreSQL) formatRegclass(schema, name string) string {
 	return fmt.Sprintf("'%s.%s'", escapedSchema, escapedName)
 }
 
-func (p *PostgreSQL) SetupConnection(db *sql.DB) error {
-	_, err := db.Exec("SET session_replication_role = 'replica'")
-	return err
+func (p *PostgreSQL) SetupStatements() []string {
+	return []string{"SET session_replication_role = 'replica'"}
 }
 
-func (p *PostgreSQL) SyncSequences(ctx context.Context, db *sql.DB) error {
+func (p *PostgreSQL) LoadSequences(ctx context.Context, db *sql.DB) ([]Sequence, error) {
 	query := `
 		SELECT
 			n.nspname AS schema,
@@ -86,42 +85,49 @@ func (p *PostgreSQL) SyncSequences(ctx context.Context, db *sql.DB) error {
 
 	rows, err := db.QueryContext(ctx, query)
 	if err != nil {
-		return fmt.Errorf("failed to query sequences: %w", err)
+		return nil, fmt.Errorf("failed to query sequences: %w", err)
 	}
 	defer rows.Close()
 
-	updatedCount := 0
+	var sequences []Sequence
 	for rows.Next() {
-		var schema, table, column, sequence string
-		if err := rows.Scan(&schema, &table, &column, &sequence); err != nil {
-			return fmt.Errorf("failed to scan sequence info: %w", err)
+		var seq Sequence
+		if err := rows.Scan(&seq.Schema, &seq.Table, &seq.Column, &seq.Name); err != nil {
+			return nil, fmt.Errorf("failed to scan sequence info: %w", err)
 		}
+		sequences = append(sequences, seq)
+	}
+	return sequences, rows.Err()
+}
 
-		fullTable := fmt.Sprintf("%s.%s", p.QuoteIdentifier(schema), p.QuoteIdentifier(table))
-		fullSeq := fmt.Sprintf("%s.%s", p.QuoteIdentifier(schema), p.QuoteIdentifier(sequence))
-
-		var maxVal sql.NullInt64
-		err := db.QueryRowContext(ctx, fmt.Sprintf("SELECT COALESCE(MAX(%s), 1) FROM %s", p.QuoteIdentifier(column), fullTable)).Scan(&maxVal)
-		if err != nil {
-			return fmt.Errorf("failed to get max value for %s.%s: %w", schema, table, err)
-		}
+func (p *PostgreSQL) SyncSequences(ctx context.Context, db *sql.DB, sequences []Sequence) error {
+	if len(sequences) == 0 {
+		return nil
+	}
 
-		// Set the sequence to the max value (setval takes a regclass, so we pass the quoted name as a string)
-		_, err = db.ExecContext(ctx, fmt.Sprintf("SELECT setval(%s, %d, true)", p.formatRegclass(schema, sequence), maxVal.Int64))
-		if err != nil {
-			return fmt.Errorf("failed to set sequence %s: %w", fullSeq, err)
-		}
-		updatedCount++
+	setvals := make([]string, len(sequences))
+	for i, seq := range sequences {
+		setvals[i] = p.setvalQuery(seq.Schema, seq.Table, seq.Column, seq.Name)
 	}
 
-	if err := rows.Err(); err != nil {
-		return err
+	// Set every sequence in a single statement rather than a MAX query and a
+	// setval round trip per sequence
+	if _, err := db.ExecContext(ctx, strings.Join(setvals, "\nUNION ALL\n")); err != nil {
+		return fmt.Errorf("failed to set sequences: %w", err)
 	}
 
-	log.Printf("Updated %d sequences", updatedCount)
+	log.Printf("Updated %d sequences", len(setvals))
 	return nil
 }
 
+// setvalQuery returns a SELECT that sets a sequence to the max value of the column it owns
+// (setval takes a regclass, so we pass the quoted name as a string)
+func (p *PostgreSQL) setvalQuery(schema, table, column, sequence string) string {
+	fullTable := fmt.Sprintf("%s.%s", p.QuoteIdentifier(schema), p.QuoteIdentifier(table))
+	return fmt.Sprintf("SELECT setval(%s, COALESCE((SELECT MAX(%s) FROM %s), 1), true)",
+		p.formatRegclass(schema, sequence), p.QuoteIdentifier(column), fullTable)
+}
+
 func (p *PostgreSQL) GetUserTablesQuery() string {
 	return `SELECT COUNT(*)
 		FROM information_schema.tables
@@ -138,6 +144,12 @@ func (p *PostgreSQL) FormatDSN(connStr string) string {
 	return connStr
 }
 
+func (p *PostgreSQL) EnableMultiStatements(dsn string) string {
+	// lib/pq uses the simple query protocol for Exec without arguments, which
+	// accepts multiple statements natively
+	return dsn
+}
+
 // Native type formatting methods
 
 func (p *PostgreSQL) FormatString(s string) string {
@@ -13,9 +13,9 @@ import (
 )
 
 const (
-	changesKey    = "kasho:changes"
+	changesKey     = "kasho:changes"
 	changesChannel = "kasho:changes"
-	changesTTL    = 24 * time.Hour
+	changesTTL     = 24 * time.Hour
 )
 
 // Change represents a database change event
@@ -83,6 +83,61 @@ func (b *KVBuffer) AddChange(ctx context.Context, change Change) error {
 	return nil
 }
 
+// PreparedChanges are changes scored and serialized, ready for AddPrepared
+type PreparedChanges struct {
+	members []redis.Z
+}
+
+// Len returns the number of prepared changes
+func (p PreparedChanges) Len() int {
+	return len(p.members)
+}
+
+// PrepareChanges scores and marshals changes for storage. A change whose
+// position cannot be parsed or which cannot be marshalled would never be
+// stored, so it is left out and its error returned instead of failing the rest.
+func (b *KVBuffer) PrepareChanges(changes []Change) (PreparedChanges, []error) {
+	var errs []error
+	members := make([]redis.Z, 0, len(changes))
+	for _, change := range changes {
+		score, err := b.parsePositionToScore(change.GetPosition())
+		if err != nil {
+			errs = append(errs, fmt.Errorf("failed to parse position: %w", err))
+			continue
+		}
+		data, err := json.Marshal(change)
+		if err != nil {
+			errs = append(errs, fmt.Errorf("failed to marshal change at %s: %w", change.GetPosition(), err))
+			continue
+		}
+		members = append(members, redis.Z{Score: score, Member: data})
+	}
+	return PreparedChanges{members: members}, errs
+}
+
+// AddPrepared adds prepared changes to the KV buffer in a single pipelined round
+// trip. Changes are published in order once they are all stored. Any error
+// comes from Redis, so the same changes can safely be retried.
+func (b *KVBuffer) AddPrepared(ctx context.Context, prepared PreparedChanges) error {
+	if len(prepared.members) == 0 {
+		return nil
+	}
+
+	_, err := b.client.Pipelined(ctx, func(pipe redis.Pipeliner) error {
+		pipe.ZAdd(ctx, changesKey, prepared.members...)
+		pipe.Expire(ctx, changesKey, changesTTL)
+		for _, member := range prepared.members {
+			pipe.Publish(ctx, changesChannel, member.Member)
+		}
+		return nil
+	})
+	if err != nil {
+		return fmt.Errorf("failed to add changes to KV: %w", err)
+	}
+
+	return nil
+}
+
 // GetChangesAfter returns all changes after the given position
 // NOTE: This method is limited to 1000 changes for backward compatibility.
 // Use GetChangesAfterBatch for paginated access to larger result sets.
@@ -121,6 +176,115 @@ func (b *KVBuffer) GetChangesAfterBatch(ctx context.Context, position string, of
 	return changes, nil
 }
 
+// ChangeCursor pages through buffered changes in position order. Each page
+// resumes from the score of the last change returned (keyset pagination), so
+// reading a page costs O(log N + limit) no matter how far into the buffer it
+// is, instead of re-skipping every earlier change as offset paging does.
+type ChangeCursor struct {
+	buffer    *KVBuffer
+	min       string  // lower bound of the next page
+	lastScore float64 // score of the last change returned
+	seen      int64   // changes already returned with lastScore
+	started   bool
+}
+
+// NewChangeCursor returns a cursor over the changes after the given position
+func (b *KVBuffer) NewChangeCursor(position string) (*ChangeCursor, error) {
+	score, err := b.parsePositionToScore(position)
+	if err != nil {
+		return nil, fmt.Errorf("failed to parse position: %w", err)
+	}
+
+	// Special case: position "bootstrap" means get all changes including bootstrap
+	minScore := fmt.Sprintf("(%g", score)
+	if position == "bootstrap" {
+		minScore = "-inf"
+	}
+
+	return &ChangeCursor{buffer: b, min: minScore}, nil
+}
+
+// Next returns up to limit changes following the previous page. A page
+// shorter than limit means the cursor has reached the end of the buffer.
+func (c *ChangeCursor) Next(ctx context.Context, limit int64) ([]json.RawMessage, error) {
+	min := c.min
+	offset := int64(0)
+	if c.started {
+		// Several changes can share a score, so resume at the last score and
+		// skip the ones already returned
+		min = strconv.FormatFloat(c.lastScore, 'g', -1, 64)
+		offset = c.seen
+	}
+
+	results, err := c.buffer.client.ZRangeByScoreWithScores(ctx, changesKey, &redis.ZRangeBy{
+		Min:    min,
+		Max:    "+inf",
+		Offset: offset,
+		Count:  limit,
+	}).Result()
+	if err != nil {
+		return nil, fmt.Errorf("failed to get changes from KV: %w", err)
+	}
+
+	changes := make([]json.RawMessage, len(results))
+	for i, result := range results {
+		member, _ := result.Member.(string)
+		changes[i] = json.RawMessage(member)
+
+		if c.started && result.Score == c.lastScore {
+			c.seen++
+		} else {
+			c.lastScore = result.Score
+			c.seen = 1
+			c.started = true
+		}
+	}
+
+	return changes, nil
+}
+
+// Each reads the remaining changes page by page and calls fn for each one.
+// The next page is fetched while fn works through the current one, so Redis
+// round trips overlap with the caller's processing instead of adding to it.
+func (c *ChangeCursor) Each(ctx context.Context, limit int64, fn func(json.RawMessage) error) error {
+	type page struct {
+		changes []json.RawMessage
+		err     error
+	}
+
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	// One page of read-ahead keeps memory bounded to two pages
+	pages := make(chan page, 1)
+	go func() {
+		defer close(pages)
+		for {
+			changes, err := c.Next(ctx, limit)
+			select {
+			case pages <- page{changes: changes, err: err}:
+			case <-ctx.Done():
+				return
+			}
+			if err != nil || int64(len(changes)) < limit {
+				return
+			}
+		}
+	}()
+
+	for p := range pages {
+		if p.err != nil {
+			return p.err
+		}
+		for _, change := range p.changes {
+			if err := fn(change); err != nil {
+				return err
+			}
+		}
+	}
+	return nil
+}
+
 // parsePositionToScore converts a database position to a Redis sorted set score
 // Supports:
 // - PostgreSQL LSN: "0/100" format
@@ -165,13 +329,32 @@ func (b *KVBuffer) parsePositionToScore(position string) (float64, error) {
 	}
 
 	// PostgreSQL LSN: "0/100" → float64
-	if parsedLSN, err := pglogrepl.ParseLSN(position); err == nil {
+	if parsedLSN, ok := parseLSN(position); ok {
 		return float64(parsedLSN), nil
 	}
 
 	return 0, fmt.Errorf("invalid position format: %s", position)
 }
 
+// parseLSN parses a PostgreSQL LSN ("16/B374D848") with two integer parses
+// instead of pglogrepl.ParseLSN's fmt.Sscanf, since it runs for every change
+// stored and every page read from the buffer
+func parseLSN(position string) (pglogrepl.LSN, bool) {
+	hi, lo, ok := strings.Cut(position, "/")
+	if !ok || hi == "" || lo == "" {
+		return 0, false
+	}
+	upper, err := strconv.ParseUint(hi, 16, 32)
+	if err != nil {
+		return 0, false
+	}
+	lower, err := strconv.ParseUint(lo, 16, 32)
+	if err != nil {
+		return 0, false
+	}
+	return pglogrepl.LSN(upper<<32 | lower), true
+}
+
 // Subscribe creates a Redis pubsub subscription
 func (b *KVBuffer) Subscribe(ctx context.Context, channel string) *redis.PubSub {
 	return b.client.Subscribe(ctx, channel)
@@ -206,4 +389,4 @@ func (b *KVBuffer) Set(ctx context.Context, key, value string) error {
 // Close closes the KV connection
 func (b *KVBuffer) Close() error {
 	return b.client.Close()
-}
\ No newline at end of file
+}
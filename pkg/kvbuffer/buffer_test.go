@@ -3,10 +3,12 @@ package kvbuffer
 import (
 	"context"
 	"encoding/json"
+	"math"
 	"strings"
 	"testing"
 
 	"github.com/go-redis/redismock/v9"
+	"github.com/jackc/pglogrepl"
 	"github.com/redis/go-redis/v9"
 )
 
@@ -146,6 +148,81 @@ func TestKVBuffer_AddChange_InvalidPosition(t *testing.T) {
 	}
 }
 
+func TestKVBuffer_AddPrepared(t *testing.T) {
+	db, mock := redismock.NewClientMock()
+	defer db.Close()
+
+	kvBuffer := &KVBuffer{client: db}
+
+	ctx := context.Background()
+	first := TestChange{Position: "0/100", Data: TestDMLData{Table: "users", Kind: "insert"}}
+	second := TestChange{Position: "0/200", Data: TestDMLData{Table: "users", Kind: "delete"}}
+
+	firstData, _ := json.Marshal(first)
+	secondData, _ := json.Marshal(second)
+
+	// All commands go out in one pipeline: the stores, one TTL refresh, then the publishes in order
+	mock.ExpectZAdd(changesKey,
+		redis.Z{Score: float64(256), Member: firstData},
+		redis.Z{Score: float64(512), Member: secondData},
+	).SetVal(2)
+	mock.ExpectExpire(changesKey, changesTTL).SetVal(true)
+	mock.ExpectPublish(changesChannel, firstData).SetVal(1)
+	mock.ExpectPublish(changesChannel, secondData).SetVal(1)
+
+	prepared, errs := kvBuffer.PrepareChanges([]Change{first, second})
+	if len(errs) != 0 {
+		t.Fatalf("PrepareChanges() errors = %v", errs)
+	}
+	if err := kvBuffer.AddPrepared(ctx, prepared); err != nil {
+		t.Errorf("AddPrepared() error = %v", err)
+	}
+
+	if err := mock.ExpectationsWereMet(); err != nil {
+		t.Errorf("Expectations were not met: %v", err)
+	}
+}
+
+func TestKVBuffer_PrepareChanges_SkipsBadChanges(t *testing.T) {
+	db, mock := redismock.NewClientMock()
+	defer db.Close()
+
+	kvBuffer := &KVBuffer{client: db}
+
+	good := TestChange{Position: "0/100", Data: TestDMLData{Table: "users", Kind: "insert"}}
+	unmarshalable := TestChange{
+		Position: "0/200",
+		Data: TestDMLData{
+			Table:        "readings",
+			Kind:         "insert",
+			ColumnNames:  []string{"value"},
+			ColumnValues: []TestColumnValueWrapper{{Value: math.NaN()}},
+		},
+	}
+	badPosition := TestChange{Position: "invalid", Data: TestDMLData{Table: "users", Kind: "insert"}}
+
+	prepared, errs := kvBuffer.PrepareChanges([]Change{good, unmarshalable, badPosition})
+	if len(errs) != 2 {
+		t.Errorf("PrepareChanges() returned %d errors, want 2: %v", len(errs), errs)
+	}
+	if prepared.Len() != 1 {
+		t.Fatalf("PrepareChanges() prepared %d changes, want 1", prepared.Len())
+	}
+
+	// The rest of the batch is still stored
+	goodData, _ := json.Marshal(good)
+	mock.ExpectZAdd(changesKey, redis.Z{Score: float64(256), Member: goodData}).SetVal(1)
+	mock.ExpectExpire(changesKey, changesTTL).SetVal(true)
+	mock.ExpectPublish(changesChannel, goodData).SetVal(1)
+
+	if err := kvBuffer.AddPrepared(context.Background(), prepared); err != nil {
+		t.Errorf("AddPrepared() error = %v", err)
+	}
+	if err := mock.ExpectationsWereMet(); err != nil {
+		t.Errorf("Expectations were not met: %v", err)
+	}
+}
+
 func TestKVBuffer_GetChangesAfter(t *testing.T) {
 	db, mock := redismock.NewClientMock()
 	defer db.Close()
@@ -236,6 +313,183 @@ func TestKVBuffer_GetChangesAfter_EmptyResult(t *testing.T) {
 	}
 }
 
+func TestChangeCursor_KeysetPagination(t *testing.T) {
+	db, mock := redismock.NewClientMock()
+	defer db.Close()
+
+	kvBuffer := &KVBuffer{client: db}
+	ctx := context.Background()
+
+	cursor, err := kvBuffer.NewChangeCursor("0/100")
+	if err != nil {
+		t.Fatalf("NewChangeCursor() error = %v", err)
+	}
+
+	// First page starts after the requested position
+	mock.ExpectZRangeByScoreWithScores(changesKey, &redis.ZRangeBy{
+		Min:   "(256",
+		Max:   "+inf",
+		Count: 2,
+	}).SetVal([]redis.Z{
+		{Score: 512, Member: `{"n":1}`},
+		{Score: 768, Member: `{"n":2}`},
+	})
+
+	// Second page resumes at the last score, skipping the one change already seen there
+	mock.ExpectZRangeByScoreWithScores(changesKey, &redis.ZRangeBy{
+		Min:    "768",
+		Max:    "+inf",
+		Offset: 1,
+		Count:  2,
+	}).SetVal([]redis.Z{
+		{Score: 768, Member: `{"n":3}`},
+		{Score: 768, Member: `{"n":4}`},
+	})
+
+	// Third page skips all three changes seen at the shared score
+	mock.ExpectZRangeByScoreWithScores(changesKey, &redis.ZRangeBy{
+		Min:    "768",
+		Max:    "+inf",
+		Offset: 3,
+		Count:  2,
+	}).SetVal([]redis.Z{
+		{Score: 1024, Member: `{"n":5}`},
+	})
+
+	var got []string
+	for {
+		page, err := cursor.Next(ctx, 2)
+		if err != nil {
+			t.Fatalf("Next() error = %v", err)
+		}
+		for _, raw := range page {
+			got = append(got, string(raw))
+		}
+		if len(page) < 2 {
+			break
+		}
+	}
+
+	want := []string{`{"n":1}`, `{"n":2}`, `{"n":3}`, `{"n":4}`, `{"n":5}`}
+	if strings.Join(got, ",") != strings.Join(want, ",") {
+		t.Errorf("cursor returned %v, want %v", got, want)
+	}
+
+	if err := mock.ExpectationsWereMet(); err != nil {
+		t.Errorf("Expectations were not met: %v", err)
+	}
+}
+
+func TestChangeCursor_Bootstrap(t *testing.T) {
+	db, mock := redismock.NewClientMock()
+	defer db.Close()
+
+	kvBuffer := &KVBuffer{client: db}
+
+	cursor, err := kvBuffer.NewChangeCursor("bootstrap")
+	if err != nil {
+		t.Fatalf("NewChangeCursor() error = %v", err)
+	}
+
+	mock.ExpectZRangeByScoreWithScores(changesKey, &redis.ZRangeBy{
+		Min:   "-inf",
+		Max:   "+inf",
+		Count: 1000,
+	}).SetVal([]redis.Z{})
+
+	page, err := cursor.Next(context.Background(), 1000)
+	if err != nil {
+		t.Fatalf("Next() error = %v", err)
+	}
+	if len(page) != 0 {
+		t.Errorf("Expected 0 changes, got %d", len(page))
+	}
+
+	if err := mock.ExpectationsWereMet(); err != nil {
+		t.Errorf("Expectations were not met: %v", err)
+	}
+}
+
+func TestChangeCursor_Each(t *testing.T) {
+	db, mock := redismock.NewClientMock()
+	defer db.Close()
+
+	kvBuffer := &KVBuffer{client: db}
+
+	cursor, err := kvBuffer.NewChangeCursor("0/100")
+	if err != nil {
+		t.Fatalf("NewChangeCursor() error = %v", err)
+	}
+
+	mock.ExpectZRangeByScoreWithScores(changesKey, &redis.ZRangeBy{
+		Min:   "(256",
+		Max:   "+inf",
+		Count: 2,
+	}).SetVal([]redis.Z{
+		{Score: 512, Member: `{"n":1}`},
+		{Score: 768, Member: `{"n":2}`},
+	})
+	mock.ExpectZRangeByScoreWithScores(changesKey, &redis.ZRangeBy{
+		Min:    "768",
+		Max:    "+inf",
+		Offset: 1,
+		Count:  2,
+	}).SetVal([]redis.Z{
+		{Score: 1024, Member: `{"n":3}`},
+	})
+
+	var got []string
+	err = cursor.Each(context.Background(), 2, func(raw json.RawMessage) error {
+		got = append(got, string(raw))
+		return nil
+	})
+	if err != nil {
+		t.Fatalf("Each() error = %v", err)
+	}
+
+	want := []string{`{"n":1}`, `{"n":2}`, `{"n":3}`}
+	if strings.Join(got, ",") != strings.Join(want, ",") {
+		t.Errorf("Each() visited %v, want %v", got, want)
+	}
+
+	if err := mock.ExpectationsWereMet(); err != nil {
+		t.Errorf("Expectations were not met: %v", err)
+	}
+}
+
+func TestChangeCursor_EachStopsOnError(t *testing.T) {
+	db, mock := redismock.NewClientMock()
+	defer db.Close()
+
+	kvBuffer := &KVBuffer{client: db}
+
+	cursor, err := kvBuffer.NewChangeCursor("0/100")
+	if err != nil {
+		t.Fatalf("NewChangeCursor() error = %v", err)
+	}
+
+	mock.ExpectZRangeByScoreWithScores(changesKey, &redis.ZRangeBy{
+		Min:   "(256",
+		Max:   "+inf",
+		Count: 1,
+	}).SetVal([]redis.Z{
+		{Score: 512, Member: `{"n":1}`},
+	})
+
+	calls := 0
+	sendErr := context.Canceled
+	err = cursor.Each(context.Background(), 1, func(raw json.RawMessage) error {
+		calls++
+		return sendErr
+	})
+	if err != sendErr {
+		t.Errorf("Each() error = %v, want %v", err, sendErr)
+	}
+	if calls != 1 {
+		t.Errorf("Expected callback to run once, ran %d times", calls)
+	}
+}
+
 func TestKVBuffer_Close(t *testing.T) {
 	db, mock := redismock.NewClientMock()
 	kvBuffer := &KVBuffer{client: db}
@@ -440,4 +694,39 @@ func TestParsePositionToScore_MySQLOrdering(t *testing.T) {
 		}
 		lastScore = score
 	}
-}
\ No newline at end of file
+}
+
+func TestParseLSN(t *testing.T) {
+	tests := []struct {
+		position string
+		want     pglogrepl.LSN
+		wantOK   bool
+	}{
+		{position: "0/100", want: 0x100, wantOK: true},
+		{position: "16/B374D848", want: 0x16B374D848, wantOK: true},
+		{position: "16/b374d848", want: 0x16B374D848, wantOK: true},
+		{position: "FFFFFFFF/FFFFFFFF", want: 0xFFFFFFFFFFFFFFFF, wantOK: true},
+		{position: "0/BOOTSTRAP00000001", wantOK: false},
+		{position: "100000000/0", wantOK: false},
+		{position: "0/", wantOK: false},
+		{position: "/100", wantOK: false},
+		{position: "invalid", wantOK: false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.position, func(t *testing.T) {
+			got, ok := parseLSN(tt.position)
+			if ok != tt.wantOK {
+				t.Fatalf("parseLSN(%q) ok = %v, want %v", tt.position, ok, tt.wantOK)
+			}
+			if ok {
+				if got != tt.want {
+					t.Errorf("parseLSN(%q) = %v, want %v", tt.position, got, tt.want)
+				}
+				if want, _ := pglogrepl.ParseLSN(tt.position); got != want {
+					t.Errorf("parseLSN(%q) = %v, pglogrepl.ParseLSN = %v", tt.position, got, want)
+				}
+			}
+		})
+	}
+}
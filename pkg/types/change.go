@@ -3,6 +3,7 @@ package types
 import (
 	"encoding/json"
 	"fmt"
+	"strconv"
 	"time"
 
 	"kasho/proto"
@@ -39,45 +40,55 @@ func (cv *ColumnValueWrapper) UnmarshalJSON(data []byte) error {
 		cv.ColumnValue = &proto.ColumnValue{}
 	}
 
-	// Check for null first - leave Value unset to represent NULL
-	if string(data) == "null" {
-		cv.Value = nil
-		return nil
+	if len(data) == 0 {
+		return fmt.Errorf("failed to unmarshal column value: empty input")
 	}
 
-	// Try int (before string to avoid treating "123" as string)
-	var intVal int64
-	if err := json.Unmarshal(data, &intVal); err == nil {
-		cv.Value = &proto.ColumnValue_IntValue{IntValue: intVal}
-		return nil
-	}
-
-	// Try float
-	var floatVal float64
-	if err := json.Unmarshal(data, &floatVal); err == nil {
-		cv.Value = &proto.ColumnValue_FloatValue{FloatValue: floatVal}
-		return nil
-	}
-
-	// Try bool
-	var boolVal bool
-	if err := json.Unmarshal(data, &boolVal); err == nil {
-		cv.Value = &proto.ColumnValue_BoolValue{BoolValue: boolVal}
-		return nil
-	}
-
-	// Try timestamp (Go's time.Time can parse RFC3339 strings)
-	var timeVal time.Time
-	if err := json.Unmarshal(data, &timeVal); err == nil {
-		cv.Value = &proto.ColumnValue_TimestampValue{TimestampValue: timeVal.Format(time.RFC3339)}
-		return nil
-	}
-
-	// Finally try string (this is the fallback)
-	var strVal string
-	if err := json.Unmarshal(data, &strVal); err == nil {
-		cv.Value = &proto.ColumnValue_StringValue{StringValue: strVal}
-		return nil
+	// Dispatch on the first byte so each value is decoded once, instead of
+	// attempting every type in turn with a full json.Unmarshal per attempt
+	switch c := data[0]; {
+	case c == 'n':
+		// null - leave Value unset to represent NULL
+		if string(data) == "null" {
+			cv.Value = nil
+			return nil
+		}
+
+	case c == 't' || c == 'f':
+		var boolVal bool
+		if err := json.Unmarshal(data, &boolVal); err == nil {
+			cv.Value = &proto.ColumnValue_BoolValue{BoolValue: boolVal}
+			return nil
+		}
+
+	case c == '-' || (c >= '0' && c <= '9'):
+		// Try int before float so "123" stays an integer
+		if intVal, err := strconv.ParseInt(string(data), 10, 64); err == nil {
+			cv.Value = &proto.ColumnValue_IntValue{IntValue: intVal}
+			return nil
+		}
+		if floatVal, err := strconv.ParseFloat(string(data), 64); err == nil {
+			cv.Value = &proto.ColumnValue_FloatValue{FloatValue: floatVal}
+			return nil
+		}
+
+	case c == '"':
+		// Try timestamp (Go's time.Time can parse RFC3339 strings), which
+		// always starts with a digit
+		if len(data) > 1 && data[1] >= '0' && data[1] <= '9' {
+			var timeVal time.Time
+			if err := timeVal.UnmarshalJSON(data); err == nil {
+				cv.Value = &proto.ColumnValue_TimestampValue{TimestampValue: timeVal.Format(time.RFC3339)}
+				return nil
+			}
+		}
+
+		// Finally try string (this is the fallback)
+		var strVal string
+		if err := json.Unmarshal(data, &strVal); err == nil {
+			cv.Value = &proto.ColumnValue_StringValue{StringValue: strVal}
+			return nil
+		}
 	}
 
 	return fmt.Errorf("failed to unmarshal column value: %s", string(data))
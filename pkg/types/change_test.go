@@ -179,11 +179,70 @@ func TestColumnValueWrapper_UnmarshalJSON(t *testing.T) {
 				},
 			},
 		},
+		{
+			name:     "negative int value",
+			jsonData: "-7",
+			want: ColumnValueWrapper{
+				ColumnValue: &proto.ColumnValue{
+					Value: &proto.ColumnValue_IntValue{IntValue: -7},
+				},
+			},
+		},
+		{
+			name:     "exponent is a float",
+			jsonData: "1e3",
+			want: ColumnValueWrapper{
+				ColumnValue: &proto.ColumnValue{
+					Value: &proto.ColumnValue_FloatValue{FloatValue: 1000},
+				},
+			},
+		},
+		{
+			name:     "numeric string stays a string",
+			jsonData: `"123"`,
+			want: ColumnValueWrapper{
+				ColumnValue: &proto.ColumnValue{
+					Value: &proto.ColumnValue_StringValue{StringValue: "123"},
+				},
+			},
+		},
+		{
+			name:     "boolean string stays a string",
+			jsonData: `"true"`,
+			want: ColumnValueWrapper{
+				ColumnValue: &proto.ColumnValue{
+					Value: &proto.ColumnValue_StringValue{StringValue: "true"},
+				},
+			},
+		},
+		{
+			name:     "date string stays a string",
+			jsonData: `"2024-03-20"`,
+			want: ColumnValueWrapper{
+				ColumnValue: &proto.ColumnValue{
+					Value: &proto.ColumnValue_StringValue{StringValue: "2024-03-20"},
+				},
+			},
+		},
+		{
+			name:     "escaped string",
+			jsonData: `"say \"hi\""`,
+			want: ColumnValueWrapper{
+				ColumnValue: &proto.ColumnValue{
+					Value: &proto.ColumnValue_StringValue{StringValue: `say "hi"`},
+				},
+			},
+		},
 		{
 			name:     "invalid json",
 			jsonData: `{"invalid": json}`,
 			wantErr:  true,
 		},
+		{
+			name:     "invalid literal",
+			jsonData: "nope",
+			wantErr:  true,
+		},
 	}
 
 	for _, tt := range tests {
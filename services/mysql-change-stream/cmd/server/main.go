@@ -103,7 +103,18 @@ func main() {
 		var clientDone <-chan struct{}
 		var changeWg sync.WaitGroup
 
+		// Act on the current state, then wait for it to change. A failed client
+		// start is retried after a second.
+		var stateChanged <-chan struct{}
+		var retry <-chan time.Time
 		for {
+			if stateChanged != nil {
+				select {
+				case <-ctx.Done():
+				case <-stateChanged:
+				case <-retry:
+				}
+			}
 			select {
 			case <-ctx.Done():
 				if client != nil {
@@ -111,8 +122,10 @@ func main() {
 					changeWg.Wait() // Wait for change processor to finish
 				}
 				return
-			case <-time.After(1 * time.Second):
-				currentState := changeStreamServer.GetState()
+			default:
+				var currentState server.State
+				currentState, stateChanged = changeStreamServer.WatchState()
+				retry = nil
 
 				// If we're in STREAMING state but don't have a client, create one
 				if currentState == server.StateStreaming && client == nil {
@@ -125,6 +138,7 @@ func main() {
 					client, err = server.NewClient(ctx, dbURL, buffer, changeStreamServer, startPos)
 					if err != nil {
 						log.Printf("Failed to create binlog client: %v", err)
+						retry = time.After(1 * time.Second)
 						continue
 					}
 					clientDone = client.Done()
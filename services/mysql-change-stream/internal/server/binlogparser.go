@@ -2,6 +2,7 @@ package server
 
 import (
 	"fmt"
+	"regexp"
 	"strings"
 	"time"
 
@@ -166,19 +167,18 @@ func RowsEventToChanges(e *canal.RowsEvent, pos mysql.Position) []types.Change {
 	return changes
 }
 
+// ddlQueryPattern matches queries that start with a DDL keyword. It is matched
+// against the raw query bytes, so non-DDL events are rejected without copying
+// or upper-casing the whole statement
+var ddlQueryPattern = regexp.MustCompile(`(?i)^\s*(?:CREATE|ALTER|DROP|RENAME|TRUNCATE)`)
+
 // QueryEventToChange converts a DDL query event to a Change
 func QueryEventToChange(header *replication.EventHeader, e *replication.QueryEvent, pos mysql.Position) *types.Change {
-	query := string(e.Query)
-
-	// Skip non-DDL queries
-	upperQuery := strings.ToUpper(strings.TrimSpace(query))
-	if !strings.HasPrefix(upperQuery, "CREATE") &&
-		!strings.HasPrefix(upperQuery, "ALTER") &&
-		!strings.HasPrefix(upperQuery, "DROP") &&
-		!strings.HasPrefix(upperQuery, "RENAME") &&
-		!strings.HasPrefix(upperQuery, "TRUNCATE") {
+	// Skip non-DDL queries, including the BEGIN that opens every row-based transaction
+	if !ddlQueryPattern.Match(e.Query) {
 		return nil
 	}
+	query := string(e.Query)
 
 	position := FormatBinlogPosition(pos)
 
@@ -142,6 +142,18 @@ func TestQueryEventToChange_DDL(t *testing.T) {
 			schema:  "testdb",
 			wantNil: false,
 		},
+		{
+			name:    "lowercase with leading whitespace",
+			query:   "\n  create index idx_users_name on users (name)",
+			schema:  "testdb",
+			wantNil: false,
+		},
+		{
+			name:    "BEGIN should be ignored",
+			query:   "BEGIN",
+			schema:  "testdb",
+			wantNil: true,
+		},
 		{
 			name:    "SELECT should be ignored",
 			query:   "SELECT * FROM users",
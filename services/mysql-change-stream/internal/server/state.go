@@ -94,6 +94,7 @@ func (s *ChangeStreamServer) TransitionState(ctx context.Context, newState State
 		s.state.Current = oldState
 		return err
 	}
+	s.notifyStateChangeLocked()
 
 	return nil
 }
@@ -11,13 +11,24 @@ import (
 	"time"
 
 	"kasho/pkg/kvbuffer"
+	"kasho/pkg/types"
 	"kasho/pkg/version"
 	"kasho/proto"
 	"pg-change-stream/internal/server"
 
+	"github.com/jackc/pglogrepl"
 	"google.golang.org/grpc"
 )
 
+const (
+	// walQueueSize bounds how many parsed WAL messages may wait to be stored
+	walQueueSize = 1024
+	// maxStoreBatch caps how many WAL messages are written to the buffer at once
+	maxStoreBatch = 256
+	// maxStoreBackoff caps the wait between retries of a failed buffer write
+	maxStoreBackoff = 5 * time.Second
+)
+
 func main() {
 	log.Printf("pg-change-stream version %s (commit: %s, built: %s)",
 		version.Version, version.GitCommit, version.BuildDate)
@@ -97,6 +108,13 @@ func main() {
 		cancel()
 	}()
 
+	// WAL processing is split in two stages: the reader below receives and parses
+	// messages and queues them, and storeChanges writes them to the KV buffer. A
+	// slow buffer write no longer stalls reading from the replication slot until
+	// the queue fills, at which point the reader blocks and stops confirming WAL.
+	received := make(chan walBatch, walQueueSize)
+	go storeChanges(ctx, buffer, changeStreamServer, received)
+
 	// Start WAL processing goroutine that monitors state changes
 	go func() {
 		var client *server.Client
@@ -109,53 +127,59 @@ func main() {
 					client.Close(ctx)
 				}
 				return
-			case <-time.After(1 * time.Second):
-				currentState := changeStreamServer.GetState()
-
-				// If we're in STREAMING state but don't have a client, create one
-				if currentState == server.StateStreaming && client == nil {
-					log.Println("In STREAMING state, starting WAL client")
-					client, err = server.NewClient(ctx, dbURL)
-					if err != nil {
-						log.Printf("Failed to create WAL client: %v", err)
-						continue
-					}
-				} else if currentState != server.StateStreaming && client != nil {
-					log.Println("Not in STREAMING state, closing WAL client")
-					client.Close(ctx)
+			default:
+			}
+
+			currentState, stateChanged := changeStreamServer.WatchState()
+
+			// If we're in STREAMING state but don't have a client, create one
+			var retry <-chan time.Time
+			if currentState == server.StateStreaming && client == nil {
+				log.Println("In STREAMING state, starting WAL client")
+				client, err = server.NewClient(ctx, dbURL)
+				if err != nil {
+					log.Printf("Failed to create WAL client: %v", err)
 					client = nil
-					continue
+					retry = time.After(1 * time.Second)
 				}
+			} else if currentState != server.StateStreaming && client != nil {
+				log.Println("Not in STREAMING state, closing WAL client")
+				client.Close(ctx)
+				client = nil
+			}
 
-				// If we have a client and we're streaming, process messages
-				if client != nil && currentState == server.StateStreaming {
-					changes, err := client.ReceiveMessage(ctx)
-					if err != nil {
-						log.Printf("Error receiving message: %v", err)
-
-						if strings.Contains(err.Error(), "connection") || strings.Contains(err.Error(), "closed") {
-							log.Println("Connection lost")
-							if err := client.ConnectWithRetry(ctx); err != nil {
-								log.Printf("Failed to reconnect: %v", err)
-								client = nil
-								continue
-							}
-						}
-						continue
-					}
+			// Until there is a client to read from, wait for the next state change
+			if client == nil {
+				select {
+				case <-ctx.Done():
+				case <-stateChanged:
+				case <-retry:
+				}
+				continue
+			}
 
-					for _, change := range changes {
-						// Store change in KV buffer
-						if err := buffer.AddChange(ctx, change); err != nil {
-							log.Printf("Error storing change in KV: %v", err)
-						}
+			// While streaming, process messages as they arrive rather than one per tick
+			changes, lsn, err := client.ReceiveMessage(ctx)
+			if err != nil {
+				log.Printf("Error receiving message: %v", err)
 
-						// Update accumulated count if in ACCUMULATING state
-						if changeStreamServer.GetState() == server.StateAccumulating {
-							changeStreamServer.IncrementAccumulated()
-						}
+				if strings.Contains(err.Error(), "connection") || strings.Contains(err.Error(), "closed") {
+					log.Println("Connection lost")
+					if err := client.ConnectWithRetry(ctx); err != nil {
+						log.Printf("Failed to reconnect: %v", err)
+						client = nil
 					}
 				}
+				continue
+			}
+
+			// Messages without WAL data (keepalives) have nothing to store or confirm
+			if lsn == 0 {
+				continue
+			}
+			select {
+			case received <- walBatch{client: client, changes: changes, lsn: lsn}:
+			case <-ctx.Done():
 			}
 		}
 	}()
@@ -163,3 +187,81 @@ func main() {
 	// Wait for shutdown signal
 	<-ctx.Done()
 }
+
+// walBatch holds the changes parsed from one WAL message
+type walBatch struct {
+	client  *server.Client
+	changes []types.Change
+	lsn     pglogrepl.LSN
+}
+
+// storeChanges writes queued WAL changes to the KV buffer, combining whatever
+// has queued up into one pipelined write. A message's position is only
+// reported to the primary as flushed once its changes are in the buffer, and
+// a failed write is retried before anything newer is stored.
+func storeChanges(ctx context.Context, buffer *kvbuffer.KVBuffer, changeStreamServer *server.ChangeStreamServer, received <-chan walBatch) {
+	var batches []walBatch
+	var changes []kvbuffer.Change
+	for {
+		select {
+		case <-ctx.Done():
+			return
+		case batch := <-received:
+			batches = append(batches[:0], batch)
+		}
+	drain:
+		for len(batches) < maxStoreBatch {
+			select {
+			case batch := <-received:
+				batches = append(batches, batch)
+			default:
+				break drain
+			}
+		}
+
+		changes = changes[:0]
+		for _, batch := range batches {
+			for _, change := range batch.changes {
+				changes = append(changes, change)
+			}
+		}
+
+		// Changes that can never be stored are dropped here, once, so they
+		// cannot hold up the rest of the batch
+		prepared, errs := buffer.PrepareChanges(changes)
+		for _, err := range errs {
+			log.Printf("Error storing change in KV, skipping it: %v", err)
+		}
+
+		// Retry the same batch until it is stored. Skipping it would let a later
+		// batch confirm its position as flushed past changes never buffered.
+		backoff := 100 * time.Millisecond
+		for {
+			err := buffer.AddPrepared(ctx, prepared)
+			if err == nil {
+				break
+			}
+			log.Printf("Error storing %d changes in KV, retrying in %v: %v", prepared.Len(), backoff, err)
+			select {
+			case <-ctx.Done():
+				return
+			case <-time.After(backoff):
+			}
+			backoff *= 2
+			if backoff > maxStoreBackoff {
+				backoff = maxStoreBackoff
+			}
+		}
+
+		// Update accumulated count if in ACCUMULATING state
+		if changeStreamServer.GetState() == server.StateAccumulating {
+			for range prepared.Len() {
+				changeStreamServer.IncrementAccumulated()
+			}
+		}
+
+		for _, batch := range batches {
+			batch.client.Flushed(batch.lsn)
+		}
+	}
+}
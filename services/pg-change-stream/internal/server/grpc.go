@@ -21,12 +21,14 @@ type ChangeStreamServer struct {
 	connectedClients int32
 	clientsMu        sync.Mutex
 	startTime        time.Time
+	stateChanged     chan struct{} // closed and replaced whenever the state changes
 }
 
 func NewChangeStreamServer(buffer *kvbuffer.KVBuffer) *ChangeStreamServer {
 	return &ChangeStreamServer{
-		buffer:    buffer,
-		startTime: time.Now(),
+		buffer:       buffer,
+		startTime:    time.Now(),
+		stateChanged: make(chan struct{}),
 		state: &StateInfo{
 			Current:        StateWaiting,
 			TransitionTime: time.Now(),
@@ -39,6 +41,7 @@ func (s *ChangeStreamServer) SetState(state *StateInfo) {
 	s.stateMu.Lock()
 	defer s.stateMu.Unlock()
 	s.state = state
+	s.notifyStateChangeLocked()
 }
 
 // GetState returns the current state
@@ -48,6 +51,22 @@ func (s *ChangeStreamServer) GetState() State {
 	return s.state.Current
 }
 
+// WatchState returns the current state together with a channel that is closed
+// the next time the state changes, so callers can wait for a transition
+// without polling
+func (s *ChangeStreamServer) WatchState() (State, <-chan struct{}) {
+	s.stateMu.RLock()
+	defer s.stateMu.RUnlock()
+	return s.state.Current, s.stateChanged
+}
+
+// notifyStateChangeLocked wakes everyone waiting on a WatchState channel.
+// The caller must hold stateMu for writing.
+func (s *ChangeStreamServer) notifyStateChangeLocked() {
+	close(s.stateChanged)
+	s.stateChanged = make(chan struct{})
+}
+
 // IncrementAccumulated increments the accumulated change count
 func (s *ChangeStreamServer) IncrementAccumulated() {
 	s.stateMu.Lock()
@@ -56,27 +75,17 @@ func (s *ChangeStreamServer) IncrementAccumulated() {
 }
 
 func (s *ChangeStreamServer) Stream(req *proto.StreamRequest, stream proto.ChangeStream_StreamServer) error {
-	// Check if we're in streaming state
-	s.stateMu.RLock()
-	currentState := s.state.Current
-	s.stateMu.RUnlock()
-	
-	if currentState != StateStreaming {
-		// Block until we're in streaming state
-		for {
-			s.stateMu.RLock()
-			if s.state.Current == StateStreaming {
-				s.stateMu.RUnlock()
-				break
-			}
-			s.stateMu.RUnlock()
-			
-			select {
-			case <-stream.Context().Done():
-				return stream.Context().Err()
-			case <-time.After(100 * time.Millisecond):
-				// Check again
-			}
+	// Block until we're in streaming state, waking on each state change
+	for {
+		currentState, stateChanged := s.WatchState()
+		if currentState == StateStreaming {
+			break
+		}
+
+		select {
+		case <-stream.Context().Done():
+			return stream.Context().Err()
+		case <-stateChanged:
 		}
 	}
 	
@@ -93,34 +102,24 @@ func (s *ChangeStreamServer) Stream(req *proto.StreamRequest, stream proto.Chang
 	// Send buffered changes first in batches
 	if req.LastPosition != "" {
 		const batchSize = 1000
-		offset := int64(0)
+		cursor, err := s.buffer.NewChangeCursor(req.LastPosition)
+		if err != nil {
+			return fmt.Errorf("failed to get buffered changes: %w", err)
+		}
 
-		for {
-			rawChanges, err := s.buffer.GetChangesAfterBatch(stream.Context(), req.LastPosition, offset, batchSize)
-			if err != nil {
-				return fmt.Errorf("failed to get buffered changes: %w", err)
+		// Pages are prefetched while the current one is being sent
+		err = cursor.Each(stream.Context(), batchSize, func(rawChange json.RawMessage) error {
+			var change types.Change
+			if err := json.Unmarshal(rawChange, &change); err != nil {
+				log.Printf("Error unmarshaling buffered change: %v", err)
+				return nil
 			}
 
-			// Send this batch
-			for _, rawChange := range rawChanges {
-				var change types.Change
-				if err := json.Unmarshal(rawChange, &change); err != nil {
-					log.Printf("Error unmarshaling buffered change: %v", err)
-					continue
-				}
-				
-				protoChange := convertToProtoChange(change)
-				if err := stream.Send(protoChange); err != nil {
-					return err
-				}
-			}
-			
-			// If we got fewer than batchSize results, we're done
-			if len(rawChanges) < batchSize {
-				break
-			}
-			
-			offset += batchSize
+			protoChange := convertToProtoChange(change)
+			return stream.Send(protoChange)
+		})
+		if err != nil {
+			return err
 		}
 	}
 
@@ -215,6 +214,7 @@ func (s *ChangeStreamServer) StartBootstrap(ctx context.Context, req *proto.Star
 		s.state.Current = StateWaiting
 		return nil, fmt.Errorf("failed to save state: %w", err)
 	}
+	s.notifyStateChangeLocked()
 	
 	return &proto.BootstrapResponse{
 		Status:             "started",
@@ -249,6 +249,7 @@ func (s *ChangeStreamServer) CompleteBootstrap(ctx context.Context, req *proto.C
 		s.state.Current = StateAccumulating
 		return nil, fmt.Errorf("failed to save state: %w", err)
 	}
+	s.notifyStateChangeLocked()
 	
 	return &proto.BootstrapResponse{
 		Status:             "completed",
@@ -246,4 +246,29 @@ func TestConvertToProtoChange_EmptyData(t *testing.T) {
 	if !reflect.DeepEqual(got, want) {
 		t.Errorf("convertToProtoChange() = %v, want %v", got, want)
 	}
-}
\ No newline at end of file
+}
+
+func TestWatchState_ClosesOnStateChange(t *testing.T) {
+	s := NewChangeStreamServer(nil)
+
+	state, changed := s.WatchState()
+	if state != StateWaiting {
+		t.Fatalf("WatchState() state = %v, want WAITING", state)
+	}
+	select {
+	case <-changed:
+		t.Fatal("channel should stay open until the state changes")
+	default:
+	}
+
+	s.SetState(&StateInfo{Current: StateStreaming, TransitionTime: time.Now()})
+
+	select {
+	case <-changed:
+	case <-time.After(time.Second):
+		t.Fatal("channel should be closed after the state changes")
+	}
+	if state, _ := s.WatchState(); state != StateStreaming {
+		t.Errorf("WatchState() state = %v, want STREAMING", state)
+	}
+}
@@ -5,24 +5,34 @@ import (
 	"fmt"
 	"log"
 	"strings"
+	"sync/atomic"
 	"time"
 
 	"kasho/pkg/types"
 
 	"github.com/jackc/pglogrepl"
 	"github.com/jackc/pgx/v5"
+	"github.com/jackc/pgx/v5/pgproto3"
 )
 
 type Client struct {
-	conn    *pgx.Conn
-	slotLSN pglogrepl.LSN
-	ticker  *time.Ticker
-	done    chan struct{}
-	dbURL   string
+	conn     *pgx.Conn
+	writeLSN atomic.Uint64 // last WAL position received from the primary
+	flushLSN atomic.Uint64 // last WAL position durably stored in the KV buffer
+	ticker   *time.Ticker
+	reply    chan struct{}
+	done     chan struct{}
+	dbURL    string
 }
 
 const (
 	maxBackoff = 30 * time.Second
+
+	// feedbackInterval is how often the client checks whether to report progress
+	feedbackInterval = 1 * time.Second
+	// keepaliveInterval is the longest the client goes without a status update,
+	// well inside the primary's default wal_sender_timeout of 60s
+	keepaliveInterval = 10 * time.Second
 )
 
 func (c *Client) Connect(ctx context.Context) error {
@@ -92,8 +102,10 @@ func (c *Client) Connect(ctx context.Context) error {
 		close(c.done)
 	}
 	c.conn = walConn
-	c.slotLSN = startLSN
-	c.ticker = time.NewTicker(10 * time.Second)
+	c.writeLSN.Store(uint64(startLSN))
+	c.flushLSN.Store(uint64(startLSN))
+	c.ticker = time.NewTicker(feedbackInterval)
+	c.reply = make(chan struct{}, 1)
 	c.done = make(chan struct{})
 
 	go c.sendStatusUpdates(ctx)
@@ -142,35 +154,87 @@ func (c *Client) Close(ctx context.Context) {
 	}
 }
 
+// sendStatusUpdates reports progress to the primary. An update is only sent
+// when the flushed position has advanced, when the primary asks for a reply,
+// or as a keepalive once keepaliveInterval passes without one.
 func (c *Client) sendStatusUpdates(ctx context.Context) {
+	var fb feedback
 	for {
 		select {
-		case <-c.ticker.C:
-			if err := pglogrepl.SendStandbyStatusUpdate(ctx, c.conn.PgConn(), pglogrepl.StandbyStatusUpdate{
-				WALWritePosition: c.slotLSN,
-				WALFlushPosition: c.slotLSN,
-				WALApplyPosition: c.slotLSN,
-			}); err != nil {
-				log.Printf("Error sending status update: %v", err)
-				return
+		case now := <-c.ticker.C:
+			if !fb.due(pglogrepl.LSN(c.flushLSN.Load()), now) {
+				continue
 			}
+		case <-c.reply:
 		case <-c.done:
 			return
 		}
+
+		write := pglogrepl.LSN(c.writeLSN.Load())
+		flush := pglogrepl.LSN(c.flushLSN.Load())
+		if err := pglogrepl.SendStandbyStatusUpdate(ctx, c.conn.PgConn(), pglogrepl.StandbyStatusUpdate{
+			WALWritePosition: write,
+			WALFlushPosition: flush,
+			WALApplyPosition: flush,
+		}); err != nil {
+			log.Printf("Error sending status update: %v", err)
+			return
+		}
+		fb.sent(flush, time.Now())
 	}
 }
 
-func (c *Client) ReceiveMessage(ctx context.Context) ([]types.Change, error) {
+// feedback tracks the last status update sent to the primary
+type feedback struct {
+	lsn  pglogrepl.LSN
+	time time.Time
+}
+
+// due reports whether a status update should be sent at now for the given flushed position
+func (f *feedback) due(flushed pglogrepl.LSN, now time.Time) bool {
+	return flushed > f.lsn || now.Sub(f.time) >= keepaliveInterval
+}
+
+func (f *feedback) sent(flushed pglogrepl.LSN, now time.Time) {
+	f.lsn = flushed
+	f.time = now
+}
+
+// ReceiveMessage reads the next replication message and returns its changes
+// along with its WAL position, or 0 if the message carried no WAL data
+func (c *Client) ReceiveMessage(ctx context.Context) ([]types.Change, pglogrepl.LSN, error) {
 	msg, err := c.conn.PgConn().ReceiveMessage(ctx)
 	if err != nil {
-		return nil, err
+		return nil, 0, err
+	}
+
+	// Answer keepalives that ask for a reply straight away, instead of on the next tick
+	if copyData, ok := msg.(*pgproto3.CopyData); ok && len(copyData.Data) > 0 && copyData.Data[0] == pglogrepl.PrimaryKeepaliveMessageByteID {
+		pkm, err := pglogrepl.ParsePrimaryKeepaliveMessage(copyData.Data[1:])
+		if err != nil {
+			return nil, 0, fmt.Errorf("error parsing keepalive: %w", err)
+		}
+		if pkm.ReplyRequested {
+			select {
+			case c.reply <- struct{}{}:
+			default:
+			}
+		}
+		return nil, 0, nil
 	}
+
 	changes, lsn, err := ParseMessage(msg)
 	if err != nil {
-		return nil, err
+		return nil, 0, err
 	}
 	if lsn != 0 {
-		c.slotLSN = lsn
+		c.writeLSN.Store(uint64(lsn))
 	}
-	return changes, nil
+	return changes, lsn, nil
+}
+
+// Flushed marks the changes up to lsn as durably stored, allowing the primary
+// to release the WAL behind them
+func (c *Client) Flushed(lsn pglogrepl.LSN) {
+	c.flushLSN.Store(uint64(lsn))
 }
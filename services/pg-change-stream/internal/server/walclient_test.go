@@ -0,0 +1,37 @@
+package server
+
+import (
+	"testing"
+	"time"
+
+	"github.com/jackc/pglogrepl"
+)
+
+func TestFeedback_Due(t *testing.T) {
+	start := time.Date(2024, 3, 20, 15, 0, 0, 0, time.UTC)
+
+	var fb feedback
+	if !fb.due(0, start) {
+		t.Error("first status update should be due immediately")
+	}
+	fb.sent(100, start)
+
+	tests := []struct {
+		name    string
+		flushed pglogrepl.LSN
+		elapsed time.Duration
+		want    bool
+	}{
+		{name: "no progress", flushed: 100, elapsed: feedbackInterval, want: false},
+		{name: "flushed position advanced", flushed: 200, elapsed: feedbackInterval, want: true},
+		{name: "keepalive interval elapsed", flushed: 100, elapsed: keepaliveInterval, want: true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := fb.due(tt.flushed, start.Add(tt.elapsed)); got != tt.want {
+				t.Errorf("due() = %v, want %v", got, tt.want)
+			}
+		})
+	}
+}
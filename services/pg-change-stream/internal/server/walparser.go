@@ -15,6 +15,119 @@ import (
 
 var relationMap = make(map[uint32]*pglogrepl.RelationMessageV2)
 
+// relationLayouts caches values derived from each relation's RELATION message,
+// so they are resolved once per relation instead of once per row
+var relationLayouts = make(map[uint32]*relationLayout)
+
+type relationLayout struct {
+	rel         *pglogrepl.RelationMessageV2
+	table       string         // qualified "schema.table" name
+	columnNames []string       // column names in tuple order
+	ddlLog      *ddlLogColumns // column positions, only set for kasho_ddl_log
+}
+
+// ddlLogColumns holds the tuple positions of the kasho_ddl_log columns, or -1 if absent
+type ddlLogColumns struct {
+	id, time, username, database, ddl int
+}
+
+func newRelationLayout(rel *pglogrepl.RelationMessageV2) *relationLayout {
+	layout := &relationLayout{
+		rel:         rel,
+		table:       rel.Namespace + "." + rel.RelationName,
+		columnNames: make([]string, len(rel.Columns)),
+	}
+	for i, col := range rel.Columns {
+		layout.columnNames[i] = col.Name
+	}
+
+	if layout.table == "public.kasho_ddl_log" {
+		cols := &ddlLogColumns{id: -1, time: -1, username: -1, database: -1, ddl: -1}
+		for i, col := range rel.Columns {
+			switch col.Name {
+			case "id":
+				cols.id = i
+			case "time":
+				cols.time = i
+			case "username":
+				cols.username = i
+			case "database":
+				cols.database = i
+			case "ddl":
+				cols.ddl = i
+			}
+		}
+		layout.ddlLog = cols
+	}
+	return layout
+}
+
+// layoutFor returns the cached layout for a relation, rebuilding it when the
+// relation has been redefined by a newer RELATION message
+func layoutFor(rel *pglogrepl.RelationMessageV2) *relationLayout {
+	if layout, ok := relationLayouts[rel.RelationID]; ok && layout.rel == rel {
+		return layout
+	}
+	layout := newRelationLayout(rel)
+	relationLayouts[rel.RelationID] = layout
+	return layout
+}
+
+// decodeAt decodes the tuple column at position i, returning nil if it is absent
+func decodeAt(rel *pglogrepl.RelationMessageV2, tuple *pglogrepl.TupleData, i int) (any, error) {
+	if i < 0 || i >= len(tuple.Columns) || tuple.Columns[i] == nil {
+		return nil, nil
+	}
+	value, err := decodeColumnData(tuple.Columns[i], rel.Columns[i].DataType)
+	if err != nil {
+		return nil, fmt.Errorf("error decoding column %s: %w", rel.Columns[i].Name, err)
+	}
+	return value, nil
+}
+
+// decodeDDL reads a kasho_ddl_log row by column position
+func (c *ddlLogColumns) decodeDDL(rel *pglogrepl.RelationMessageV2, tuple *pglogrepl.TupleData) (types.DDLData, error) {
+	ddl := types.DDLData{}
+
+	value, err := decodeAt(rel, tuple, c.id)
+	if err != nil {
+		return ddl, err
+	}
+	if id, ok := value.(int32); ok {
+		ddl.ID = int(id)
+	}
+
+	if value, err = decodeAt(rel, tuple, c.time); err != nil {
+		return ddl, err
+	}
+	if t, ok := value.(time.Time); ok {
+		ddl.Time = t
+	}
+
+	if value, err = decodeAt(rel, tuple, c.username); err != nil {
+		return ddl, err
+	}
+	if username, ok := value.(string); ok {
+		ddl.Username = username
+	}
+
+	if value, err = decodeAt(rel, tuple, c.database); err != nil {
+		return ddl, err
+	}
+	if db, ok := value.(string); ok {
+		ddl.Database = db
+	}
+
+	if value, err = decodeAt(rel, tuple, c.ddl); err != nil {
+		return ddl, err
+	}
+	if ddlStr, ok := value.(string); ok {
+		ddl.DDL = ddlStr
+	}
+
+	return ddl, nil
+}
+
 func ParseMessage(msg pgproto3.BackendMessage) ([]types.Change, pglogrepl.LSN, error) {
 	copyData, ok := msg.(*pgproto3.CopyData)
 	if !ok {
@@ -154,54 +267,22 @@ func ParseWALData(walData []byte, lsn pglogrepl.LSN) ([]types.Change, error) {
 			return nil, fmt.Errorf("unknown relation ID %d", v.RelationID)
 		}
 
-		tableName := fmt.Sprintf("%s.%s", rel.Namespace, rel.RelationName)
-		if tableName == "public.kasho_ddl_log" {
-			ddl := types.DDLData{}
-			for i, col := range rel.Columns {
-				if i < len(v.Tuple.Columns) {
-					colData := v.Tuple.Columns[i]
-					if colData == nil {
-						continue
-					}
-					value, err := decodeColumnData(colData, col.DataType)
-					if err != nil {
-						return nil, fmt.Errorf("error decoding column %s: %w", col.Name, err)
-					}
-					switch col.Name {
-					case "id":
-						if id, ok := value.(int32); ok {
-							ddl.ID = int(id)
-						}
-					case "time":
-						if t, ok := value.(time.Time); ok {
-							ddl.Time = t
-						}
-					case "username":
-						if username, ok := value.(string); ok {
-							ddl.Username = username
-						}
-					case "database":
-						if db, ok := value.(string); ok {
-							ddl.Database = db
-						}
-					case "ddl":
-						if ddlStr, ok := value.(string); ok {
-							ddl.DDL = ddlStr
-						}
-					}
-				}
+		layout := layoutFor(rel)
+		if layout.ddlLog != nil {
+			ddl, err := layout.ddlLog.decodeDDL(rel, v.Tuple)
+			if err != nil {
+				return nil, err
 			}
 			changes = append(changes, types.Change{Position: lsn.String(), Data: ddl})
 		} else {
 			dml := types.DMLData{
-				Table:        tableName,
+				Table:        layout.table,
 				Kind:         "insert",
-				ColumnNames:  make([]string, 0, len(rel.Columns)),
+				ColumnNames:  layout.columnNames,
 				ColumnValues: make([]types.ColumnValueWrapper, 0, len(v.Tuple.Columns)),
 			}
 
 			for i, col := range rel.Columns {
-				dml.ColumnNames = append(dml.ColumnNames, col.Name)
 				if i < len(v.Tuple.Columns) {
 					colData := v.Tuple.Columns[i]
 					if colData == nil {
@@ -233,7 +314,7 @@ func ParseWALData(walData []byte, lsn pglogrepl.LSN) ([]types.Change, error) {
 		}
 
 		dml := types.DMLData{
-			Table:        fmt.Sprintf("%s.%s", rel.Namespace, rel.RelationName),
+			Table:        layoutFor(rel).table,
 			Kind:         "update",
 			ColumnNames:  make([]string, 0),
 			ColumnValues: make([]types.ColumnValueWrapper, 0),
@@ -259,7 +340,7 @@ func ParseWALData(walData []byte, lsn pglogrepl.LSN) ([]types.Change, error) {
 			for i, col := range rel.Columns {
 				if i < len(v.OldTuple.Columns) {
 					colData := v.OldTuple.Columns[i]
-					if colData != nil {
+					if colData != nil && colData.DataType != pglogrepl.TupleDataTypeToast {
 						value, err := decodeColumnData(colData, col.DataType)
 						if err != nil {
 							return nil, fmt.Errorf("error decoding old column %s: %w", col.Name, err)
@@ -279,10 +360,14 @@ func ParseWALData(walData []byte, lsn pglogrepl.LSN) ([]types.Change, error) {
 		// - Non-PK columns: Not found in oldValues, so all are included in output
 		//
 		// This will cause UPDATE statements to include all columns even when only some were changed.
+		//
+		// Unchanged TOASTed values are sent as a 'u' marker with no data. They are left out
+		// entirely: the replica already holds the value, and emitting them would put large
+		// columns (or an empty placeholder) into every buffered update.
 		for i, col := range rel.Columns {
 			if i < len(v.NewTuple.Columns) {
 				colData := v.NewTuple.Columns[i]
-				if colData == nil {
+				if colData == nil || colData.DataType == pglogrepl.TupleDataTypeToast {
 					continue
 				}
 				newValue, err := decodeColumnData(colData, col.DataType)
@@ -313,6 +398,12 @@ func ParseWALData(walData []byte, lsn pglogrepl.LSN) ([]types.Change, error) {
 			}
 		}
 
+		// Nothing is left to set when the update changed only unchanged TOASTed
+		// or key columns (e.g. SET id = id), so there is no statement to replay
+		if len(dml.ColumnNames) == 0 {
+			break
+		}
+
 		changes = append(changes, types.Change{Position: lsn.String(), Data: dml})
 
 	case *pglogrepl.DeleteMessageV2:
@@ -322,7 +413,7 @@ func ParseWALData(walData []byte, lsn pglogrepl.LSN) ([]types.Change, error) {
 		}
 
 		dml := types.DMLData{
-			Table:        fmt.Sprintf("%s.%s", rel.Namespace, rel.RelationName),
+			Table:        layoutFor(rel).table,
 			Kind:         "delete",
 			ColumnNames:  make([]string, 0, len(rel.Columns)),
 			ColumnValues: make([]types.ColumnValueWrapper, 0, len(v.OldTuple.Columns)),
@@ -599,6 +599,81 @@ func TestParseWALData_UpdateMessage(t *testing.T) {
 	delete(relationMap, 3)
 }
 
+func TestParseWALData_UpdateSkipsUnchangedToast(t *testing.T) {
+	relationMap[5] = &pglogrepl.RelationMessageV2{
+		RelationMessage: pglogrepl.RelationMessage{
+			RelationID:   5,
+			Namespace:    "public",
+			RelationName: "documents",
+			Columns: []*pglogrepl.RelationMessageColumn{
+				{Name: "id", DataType: 23, Flags: 1},
+				{Name: "title", DataType: 25, Flags: 0},
+				{Name: "body", DataType: 25, Flags: 0},
+			},
+		},
+	}
+	defer delete(relationMap, 5)
+	defer delete(relationLayouts, 5)
+
+	// pgoutput UPDATE: 'U', relation ID, then a new tuple ('N') of three columns
+	// where "body" is an unchanged TOASTed value ('u', no data)
+	data := []byte{'U', 0, 0, 0, 5, 'N', 0, 3}
+	data = append(data, 't', 0, 0, 0, 1, '1')
+	data = append(data, 't', 0, 0, 0, 3, 'n', 'e', 'w')
+	data = append(data, 'u')
+
+	changes, err := ParseWALData(data, pglogrepl.LSN(500))
+	if err != nil {
+		t.Fatalf("ParseWALData() error = %v", err)
+	}
+	if len(changes) != 1 {
+		t.Fatalf("Expected 1 change, got %d", len(changes))
+	}
+
+	dml, ok := changes[0].Data.(types.DMLData)
+	if !ok {
+		t.Fatalf("Expected DMLData, got %T", changes[0].Data)
+	}
+	if !reflect.DeepEqual(dml.ColumnNames, []string{"title"}) {
+		t.Errorf("ColumnNames = %v, want [title]", dml.ColumnNames)
+	}
+	if len(dml.ColumnValues) != 1 || dml.ColumnValues[0].GetStringValue() != "new" {
+		t.Errorf("ColumnValues = %v, want [new]", dml.ColumnValues)
+	}
+	if !reflect.DeepEqual(dml.OldKeys.KeyNames, []string{"id"}) {
+		t.Errorf("OldKeys.KeyNames = %v, want [id]", dml.OldKeys.KeyNames)
+	}
+}
+
+func TestParseWALData_UpdateWithNothingToSetIsDropped(t *testing.T) {
+	relationMap[6] = &pglogrepl.RelationMessageV2{
+		RelationMessage: pglogrepl.RelationMessage{
+			RelationID:   6,
+			Namespace:    "public",
+			RelationName: "docs",
+			Columns: []*pglogrepl.RelationMessageColumn{
+				{Name: "id", DataType: 23, Flags: 1},
+				{Name: "body", DataType: 25, Flags: 0},
+			},
+		},
+	}
+	defer delete(relationMap, 6)
+	defer delete(relationLayouts, 6)
+
+	// UPDATE docs SET id = id: the key and an unchanged TOASTed "body" ('u')
+	data := []byte{'U', 0, 0, 0, 6, 'N', 0, 2}
+	data = append(data, 't', 0, 0, 0, 1, '1')
+	data = append(data, 'u')
+
+	changes, err := ParseWALData(data, pglogrepl.LSN(600))
+	if err != nil {
+		t.Fatalf("ParseWALData() error = %v", err)
+	}
+	if len(changes) != 0 {
+		t.Errorf("Expected no changes, got %d", len(changes))
+	}
+}
+
 func TestParseWALData_DeleteMessage(t *testing.T) {
 	// Set up relation for delete test
 	relationMap[4] = &pglogrepl.RelationMessageV2{
@@ -718,3 +793,80 @@ func TestParseWALData_DDLInsert_MissingFields(t *testing.T) {
 	// Clean up
 	delete(relationMap, 5)
 }
+
+func TestNewRelationLayout(t *testing.T) {
+	rel := &pglogrepl.RelationMessageV2{
+		RelationMessage: pglogrepl.RelationMessage{
+			RelationID:   6,
+			Namespace:    "public",
+			RelationName: "kasho_ddl_log",
+			Columns: []*pglogrepl.RelationMessageColumn{
+				{Name: "id", DataType: 23, Flags: 1},
+				{Name: "ddl", DataType: 25, Flags: 0},
+				{Name: "time", DataType: 1114, Flags: 0},
+			},
+		},
+	}
+
+	layout := newRelationLayout(rel)
+	if layout.table != "public.kasho_ddl_log" {
+		t.Errorf("Expected table public.kasho_ddl_log, got %s", layout.table)
+	}
+	if len(layout.columnNames) != 3 || layout.columnNames[1] != "ddl" {
+		t.Errorf("Unexpected column names: %v", layout.columnNames)
+	}
+	if layout.ddlLog == nil {
+		t.Fatal("Expected DDL log column positions for kasho_ddl_log")
+	}
+
+	want := ddlLogColumns{id: 0, time: 2, username: -1, database: -1, ddl: 1}
+	if *layout.ddlLog != want {
+		t.Errorf("Expected DDL log columns %+v, got %+v", want, *layout.ddlLog)
+	}
+
+	ddl, err := layout.ddlLog.decodeDDL(rel, &pglogrepl.TupleData{
+		Columns: []*pglogrepl.TupleDataColumn{
+			{DataType: 't', Data: []byte("7")},
+			{DataType: 't', Data: []byte("CREATE TABLE t (id INT)")},
+			{DataType: 't', Data: []byte("2024-03-20 15:00:00")},
+		},
+	})
+	if err != nil {
+		t.Fatalf("decodeDDL() error = %v", err)
+	}
+	if ddl.ID != 7 || ddl.DDL != "CREATE TABLE t (id INT)" || ddl.Username != "" {
+		t.Errorf("Unexpected DDL data: %+v", ddl)
+	}
+	if !ddl.Time.Equal(time.Date(2024, 3, 20, 15, 0, 0, 0, time.UTC)) {
+		t.Errorf("Unexpected DDL time: %v", ddl.Time)
+	}
+}
+
+func TestLayoutFor_RebuildsOnNewRelationMessage(t *testing.T) {
+	first := &pglogrepl.RelationMessageV2{
+		RelationMessage: pglogrepl.RelationMessage{
+			RelationID:   7,
+			Namespace:    "public",
+			RelationName: "users",
+		},
+	}
+	if got := layoutFor(first); got.table != "public.users" || got.ddlLog != nil {
+		t.Errorf("Unexpected layout: %+v", got)
+	}
+	if layoutFor(first) != layoutFor(first) {
+		t.Error("Expected the layout to be cached for the same relation message")
+	}
+
+	renamed := &pglogrepl.RelationMessageV2{
+		RelationMessage: pglogrepl.RelationMessage{
+			RelationID:   7,
+			Namespace:    "public",
+			RelationName: "accounts",
+		},
+	}
+	if got := layoutFor(renamed); got.table != "public.accounts" {
+		t.Errorf("Expected layout to be rebuilt for renamed relation, got %s", got.table)
+	}
+
+	delete(relationLayouts, 7)
+}
@@ -7,12 +7,15 @@ import (
 	"log"
 	"os"
 	"os/signal"
+	"strings"
+	"sync"
 	"syscall"
 	"time"
 
 	"kasho/pkg/dialect"
 	"kasho/pkg/version"
 	"kasho/proto"
+	"translicator/internal/apply"
 	"translicator/internal/sql"
 	"translicator/internal/transform"
 
@@ -24,6 +27,22 @@ import (
 
 const (
 	maxBackoff = 30 * time.Second
+
+	// changeQueueSize bounds how many received changes may wait to be applied.
+	// Once it is full the receiver stops reading from the stream, and gRPC flow
+	// control holds back the change stream until the replica catches up
+	changeQueueSize = 1024
+
+	// maxOpenConns and maxIdleConns size the replica connection pool shared by
+	// the applier and the periodic sequence sync
+	maxOpenConns = 8
+	maxIdleConns = 2
+
+	// maxBatchSize and maxBatchBytes cap the number of statements and the
+	// amount of SQL sent to the replica at once. A run of inserts into one
+	// table may exceed maxBatchSize until it fills a full multi-row INSERT.
+	maxBatchSize  = 256
+	maxBatchBytes = 4 << 20
 )
 
 func connectWithRetry[T any](ctx context.Context, connectFn func() (T, error)) (T, error) {
@@ -94,14 +113,19 @@ func main() {
 	sqlGenerator := sql.NewSQLGenerator(dbDialect)
 
 	// Convert connection string to driver-specific DSN format
-	dsn := dbDialect.FormatDSN(dbConnStr)
+	// Batches are sent as a single multi-statement Exec
+	dsn := dbDialect.EnableMultiStatements(dbDialect.FormatDSN(dbConnStr))
 
 	db, err := connectWithRetry(ctx, func() (*dbsql.DB, error) {
 		log.Printf("Connecting to replica database ...")
-		db, err := dbsql.Open(dbDialect.GetDriverName(), dsn)
+		// Every pooled connection runs the dialect's session setup, so the
+		// applier, sequence sync and reconnects all see the same settings
+		db, err := dialect.OpenDB(dbDialect, dsn)
 		if err != nil {
 			return nil, err
 		}
+		db.SetMaxOpenConns(maxOpenConns)
+		db.SetMaxIdleConns(maxIdleConns)
 		if err := db.Ping(); err != nil {
 			db.Close()
 			return nil, err
@@ -114,27 +138,40 @@ func main() {
 	defer db.Close()
 	log.Printf("Successfully connected to replica database")
 
-	// Set up connection for replication (dialect-specific)
-	if err := dbDialect.SetupConnection(db); err != nil {
-		log.Fatalf("Failed to set up connection: %v", err)
-	}
-	log.Printf("Connection setup complete for %s dialect", dbDialect.Name())
-
 	// Start periodic sequence/auto-increment sync
 	syncTicker := time.NewTicker(15 * time.Second)
 	defer syncTicker.Stop()
 
-	hasInserts := false
+	// Tables inserted into since the last sync; only their sequences can have advanced.
+	// The catalog of which tables own sequences is cached until the next DDL.
+	var insertedMu sync.Mutex
+	insertedTables := make(map[string]struct{})
+	sequences := dialect.NewSequenceCatalog(dbDialect)
+
+	// recordInsert is called by the applier once an insert is committed, so a
+	// sync never runs before the rows it should account for are visible
+	recordInsert := func(table string) {
+		insertedMu.Lock()
+		insertedTables[table] = struct{}{}
+		insertedMu.Unlock()
+	}
 
 	go func() {
 		for {
 			select {
 			case <-syncTicker.C:
-				if hasInserts {
-					if err := dbDialect.SyncSequences(ctx, db); err != nil {
+				insertedMu.Lock()
+				tables := make([]string, 0, len(insertedTables))
+				for table := range insertedTables {
+					tables = append(tables, table)
+				}
+				clear(insertedTables)
+				insertedMu.Unlock()
+
+				if len(tables) > 0 {
+					if err := sequences.Sync(ctx, db, tables); err != nil {
 						log.Printf("Error during sequence sync: %v", err)
 					}
-					hasInserts = false
 				}
 			case <-ctx.Done():
 				return
@@ -168,15 +205,97 @@ func main() {
 		cancel()
 	}()
 
+	// Per-change logging is costly on the apply path, so it is only enabled
+	// with LOG_LEVEL=debug
+	debug := strings.EqualFold(os.Getenv("LOG_LEVEL"), "debug")
+
+	// queueChange transforms a change and queues its SQL on the applier
+	queueChange := func(applier *apply.Applier, change *proto.Change) {
+		transformedChange, err := transform.TransformChange(config, change)
+		if err != nil {
+			log.Printf("Error transforming change: %v", err)
+			return
+		}
+
+		// Debug: Check if transform was applied
+		if dml := change.GetDml(); debug && dml != nil && dml.Table == "users" {
+			transformedDml := transformedChange.GetDml()
+			if transformedDml != nil && len(transformedDml.ColumnNames) > 0 {
+				// Find password column index
+				for i, col := range transformedDml.ColumnNames {
+					if col == "password" && i < len(dml.ColumnValues) && i < len(transformedDml.ColumnValues) {
+						origPwd := "nil"
+						transPwd := "nil"
+						if dml.ColumnValues[i] != nil {
+							origPwd = fmt.Sprintf("%v", dml.ColumnValues[i].GetStringValue())[:20] + "..."
+						}
+						if transformedDml.ColumnValues[i] != nil {
+							transPwd = fmt.Sprintf("%v", transformedDml.ColumnValues[i].GetStringValue())[:20] + "..."
+						}
+						log.Printf("Transform debug - users table password: original=%s, transformed=%s", origPwd, transPwd)
+						break
+					}
+				}
+			}
+		}
+
+		// Inserts are queued as rows so consecutive inserts into the same
+		// table are written as one multi-row INSERT
+		if dml := transformedChange.GetDml(); dml != nil && dml.Kind == "insert" {
+			head, row, err := sqlGenerator.ToInsertParts(dml)
+			if err != nil {
+				log.Printf("Error generating SQL: %v", err)
+				return
+			}
+			applier.AddInsert(dml.Table, head, row)
+
+			if debug {
+				log.Printf("%s (%s): %s%s;", change.Position, change.Type, head, row)
+			}
+			return
+		}
+
+		stmt, err := sqlGenerator.ToSQL(transformedChange)
+		if err != nil {
+			log.Printf("Error generating SQL: %v", err)
+			return
+		}
+
+		// DDL is applied on its own so a batch never mixes schema and data changes
+		// (MySQL would implicitly commit the surrounding transaction)
+		isDDL := transformedChange.GetDdl() != nil
+		if isDDL {
+			applier.Flush(ctx)
+		}
+		applier.Add(stmt)
+		if isDDL {
+			applier.Flush(ctx)
+			sqlGenerator.ResetCache()
+			sequences.Invalidate()
+		}
+
+		if debug {
+			log.Printf("%s (%s): %s", change.Position, change.Type, stmt)
+		}
+	}
+
 	// Main replication loop
 	go func() {
+		// How far the stream has been applied. Once something is applied, a
+		// reconnect resumes from it instead of probing the replica again.
+		var progress apply.Progress
+
 		for {
 			select {
 			case <-ctx.Done():
 				return
 			default:
-				// Check if replica database has any user tables to determine starting position
-				lastPosition := determineStartingPosition(db, dbDialect)
+				lastPosition, skip := progress.Resume()
+				if lastPosition == "" {
+					// Check if replica database has any user tables to determine starting position
+					lastPosition = determineStartingPosition(db, dbDialect)
+				}
+				progress.Started(lastPosition)
 				log.Printf("Starting stream from position: %s", lastPosition)
 
 				stream, err := streamClient.Stream(ctx, &proto.StreamRequest{LastPosition: lastPosition})
@@ -186,57 +305,39 @@ func main() {
 					continue
 				}
 
-				for {
-					change, err := stream.Recv()
-					if err != nil {
-						log.Printf("Error receiving change: %v", err)
-						break
-					}
-
-					transformedChange, err := transform.TransformChange(config, change)
-					if err != nil {
-						log.Printf("Error transforming change: %v", err)
+				changes := make(chan *proto.Change, changeQueueSize)
+				go receiveChanges(ctx, stream, changes)
+
+				// Apply whatever has already arrived as one batch, so a burst of
+				// changes costs one round trip to the replica instead of one each
+				applier := apply.NewApplier(db, recordInsert)
+				var batch []string
+				for change := range changes {
+					// The stream resumes before a partly applied group of changes
+					// sharing one position; skip the ones already applied
+					if skip > 0 {
+						skip--
 						continue
 					}
-
-					// Debug: Check if transform was applied
-					if dml := change.GetDml(); dml != nil && dml.Table == "users" {
-						transformedDml := transformedChange.GetDml()
-						if transformedDml != nil && len(transformedDml.ColumnNames) > 0 {
-							// Find password column index
-							for i, col := range transformedDml.ColumnNames {
-								if col == "password" && i < len(dml.ColumnValues) && i < len(transformedDml.ColumnValues) {
-									origPwd := "nil"
-									transPwd := "nil"
-									if dml.ColumnValues[i] != nil {
-										origPwd = fmt.Sprintf("%v", dml.ColumnValues[i].GetStringValue())[:20] + "..."
-									}
-									if transformedDml.ColumnValues[i] != nil {
-										transPwd = fmt.Sprintf("%v", transformedDml.ColumnValues[i].GetStringValue())[:20] + "..."
-									}
-									log.Printf("Transform debug - users table password: original=%s, transformed=%s", origPwd, transPwd)
-									break
-								}
+					queueChange(applier, change)
+					batch = append(batch[:0], change.Position)
+				drain:
+					for (applier.Len() < maxBatchSize || applier.InsertRun()) && applier.Size() < maxBatchBytes {
+						select {
+						case next, ok := <-changes:
+							if !ok {
+								break drain
 							}
+							queueChange(applier, next)
+							batch = append(batch, next.Position)
+						default:
+							break drain
 						}
 					}
-
-					stmt, err := sqlGenerator.ToSQL(transformedChange)
-					if err != nil {
-						log.Printf("Error generating SQL: %v", err)
-						continue
-					}
-
-					if _, err := db.ExecContext(ctx, stmt); err != nil {
-						log.Printf("Error executing SQL: %v", err)
-						continue
-					}
-
-					if dml := transformedChange.GetDml(); dml != nil && dml.Kind == "insert" {
-						hasInserts = true
+					applier.Flush(ctx)
+					for _, position := range batch {
+						progress.Applied(position)
 					}
-
-					log.Printf("%s (%s): %s", change.Position, change.Type, stmt)
 				}
 			}
 		}
@@ -247,6 +348,24 @@ func main() {
 	log.Println("Shutting down translicator")
 }
 
+// receiveChanges reads changes from the stream into the channel until the
+// stream fails, then closes the channel
+func receiveChanges(ctx context.Context, stream proto.ChangeStream_StreamClient, changes chan<- *proto.Change) {
+	defer close(changes)
+	for {
+		change, err := stream.Recv()
+		if err != nil {
+			log.Printf("Error receiving change: %v", err)
+			return
+		}
+		select {
+		case changes <- change:
+		case <-ctx.Done():
+			return
+		}
+	}
+}
+
 // determineStartingPosition checks if the replica has any user tables
 // Returns "bootstrap" if empty (needs bootstrap), or "" if tables exist
 func determineStartingPosition(db *dbsql.DB, dbDialect dialect.Dialect) string {
@@ -0,0 +1,198 @@
+package apply
+
+import (
+	"context"
+	dbsql "database/sql"
+	"fmt"
+	"log"
+	"strings"
+)
+
+// statement is a queued statement. Consecutive inserts sharing the same head
+// (table and columns) are coalesced into one multi-row INSERT.
+type statement struct {
+	table string   // table an INSERT writes to; empty for plain statements
+	head  string   // INSERT head shared by rows; empty for plain statements
+	rows  []string // row tuples for an INSERT, or the single plain statement
+}
+
+// maxRowsPerInsert caps the rows in one coalesced INSERT, keeping statements
+// well under server packet and parameter limits
+const maxRowsPerInsert = 1000
+
+func (s statement) sql() string {
+	if s.head == "" {
+		return s.rows[0]
+	}
+
+	size := len(s.head) + len(";") + len(", ")*(len(s.rows)-1)
+	for _, row := range s.rows {
+		size += len(row)
+	}
+	var b strings.Builder
+	b.Grow(size)
+	b.WriteString(s.head)
+	for i, row := range s.rows {
+		if i > 0 {
+			b.WriteString(", ")
+		}
+		b.WriteString(row)
+	}
+	b.WriteString(";")
+	return b.String()
+}
+
+// Applier queues SQL statements for the replica and executes them in batches,
+// so a run of N changes costs a single network round trip instead of N
+type Applier struct {
+	db         *dbsql.DB
+	onInserted func(table string)
+	pending    []statement
+	count      int
+	size       int
+}
+
+// NewApplier creates a new Applier writing to the given database.
+// The connection must allow multiple statements per Exec (see
+// dialect.EnableMultiStatements). If onInserted is not nil, it is called with
+// the table of each insert once the insert has been committed.
+func NewApplier(db *dbsql.DB, onInserted func(table string)) *Applier {
+	return &Applier{db: db, onInserted: onInserted}
+}
+
+// Add queues a statement to be executed on the next Flush
+func (a *Applier) Add(stmt string) {
+	a.pending = append(a.pending, statement{rows: []string{stmt}})
+	a.count++
+	a.size += len(stmt)
+}
+
+// AddInsert queues an insert row into table. If the previous queued statement
+// is an insert with the same head, the row is appended to it as another VALUES tuple.
+func (a *Applier) AddInsert(table, head, row string) {
+	if n := len(a.pending); n > 0 && a.pending[n-1].head == head && len(a.pending[n-1].rows) < maxRowsPerInsert {
+		a.pending[n-1].rows = append(a.pending[n-1].rows, row)
+		a.size += len(row) + len(", ")
+	} else {
+		a.pending = append(a.pending, statement{table: table, head: head, rows: []string{row}})
+		a.size += len(head) + len(row) + len(";")
+	}
+	a.count++
+}
+
+// Len returns the number of queued changes
+func (a *Applier) Len() int {
+	return a.count
+}
+
+// InsertRun reports whether everything queued is a single coalesced INSERT
+// that can still take more rows, so a caller can keep filling it past its
+// usual batch size
+func (a *Applier) InsertRun() bool {
+	return len(a.pending) == 1 && a.pending[0].head != "" && len(a.pending[0].rows) < maxRowsPerInsert
+}
+
+// Size returns the approximate size in bytes of the queued SQL
+func (a *Applier) Size() int {
+	return a.size
+}
+
+// Flush executes all queued statements as one multi-statement Exec inside a
+// transaction. If the batch fails it is rolled back and the changes are
+// replayed one at a time, so a single bad row is logged and skipped without
+// losing the rest of the batch. Returns the number of changes that failed.
+func (a *Applier) Flush(ctx context.Context) int {
+	if a.count == 0 {
+		return 0
+	}
+	defer func() {
+		a.pending = a.pending[:0]
+		a.count = 0
+		a.size = 0
+	}()
+
+	// Fast path: a single statement, typically a run of inserts into one table
+	// coalesced into one multi-row INSERT, is atomic on its own and is sent
+	// without the BEGIN/COMMIT round trips of a batch transaction
+	var err error
+	if len(a.pending) == 1 {
+		_, err = a.db.ExecContext(ctx, a.pending[0].sql())
+		if err != nil && a.count == 1 {
+			log.Printf("Error executing SQL: %v", err)
+			return 1
+		}
+	} else {
+		err = a.execBatch(ctx)
+	}
+	if err == nil {
+		for _, s := range a.pending {
+			a.inserted(s.table)
+		}
+		return 0
+	}
+
+	log.Printf("Error executing batch of %d changes, retrying individually: %v", a.count, err)
+	failed := 0
+	for _, stmt := range a.individual() {
+		if _, err := a.db.ExecContext(ctx, stmt.sql); err != nil {
+			log.Printf("Error executing SQL: %v", err)
+			failed++
+			continue
+		}
+		a.inserted(stmt.table)
+	}
+	return failed
+}
+
+// inserted reports a committed insert into table, ignoring plain statements
+func (a *Applier) inserted(table string) {
+	if table != "" && a.onInserted != nil {
+		a.onInserted(table)
+	}
+}
+
+func (a *Applier) execBatch(ctx context.Context) error {
+	tx, err := a.db.BeginTx(ctx, nil)
+	if err != nil {
+		return fmt.Errorf("failed to begin transaction: %w", err)
+	}
+	if _, err := tx.ExecContext(ctx, a.batchSQL()); err != nil {
+		tx.Rollback()
+		return err
+	}
+	if err := tx.Commit(); err != nil {
+		return fmt.Errorf("failed to commit batch: %w", err)
+	}
+	return nil
+}
+
+// batchSQL renders the queued statements as one multi-statement string
+func (a *Applier) batchSQL() string {
+	stmts := make([]string, len(a.pending))
+	for i, s := range a.pending {
+		stmts[i] = s.sql()
+	}
+	return strings.Join(stmts, "\n")
+}
+
+// single is one change's statement, with the table it inserts into if any
+type single struct {
+	sql   string
+	table string
+}
+
+// individual renders one statement per queued change, splitting coalesced
+// inserts back into single-row INSERTs
+func (a *Applier) individual() []single {
+	stmts := make([]single, 0, a.count)
+	for _, s := range a.pending {
+		if s.head == "" {
+			stmts = append(stmts, single{sql: s.rows[0]})
+			continue
+		}
+		for _, row := range s.rows {
+			stmts = append(stmts, single{sql: s.head + row + ";", table: s.table})
+		}
+	}
+	return stmts
+}
@@ -0,0 +1,289 @@
+package apply
+
+import (
+	"context"
+	dbsql "database/sql"
+	"database/sql/driver"
+	"errors"
+	"reflect"
+	"strings"
+	"testing"
+)
+
+func TestApplier_CoalescesConsecutiveInserts(t *testing.T) {
+	a := NewApplier(nil, nil)
+	a.AddInsert("users", "INSERT INTO users (id, name) VALUES ", "(1, 'a')")
+	a.AddInsert("users", "INSERT INTO users (id, name) VALUES ", "(2, 'b')")
+	a.Add("DELETE FROM users WHERE id = 1;")
+	a.AddInsert("users", "INSERT INTO users (id, name) VALUES ", "(3, 'c')")
+	a.AddInsert("orders", "INSERT INTO orders (id) VALUES ", "(10)")
+
+	if got := a.Len(); got != 5 {
+		t.Errorf("Len() = %d, want 5", got)
+	}
+
+	wantBatch := "INSERT INTO users (id, name) VALUES (1, 'a'), (2, 'b');\n" +
+		"DELETE FROM users WHERE id = 1;\n" +
+		"INSERT INTO users (id, name) VALUES (3, 'c');\n" +
+		"INSERT INTO orders (id) VALUES (10);"
+	if got := a.batchSQL(); got != wantBatch {
+		t.Errorf("batchSQL() = %q, want %q", got, wantBatch)
+	}
+
+	wantIndividual := []string{
+		"INSERT INTO users (id, name) VALUES (1, 'a');",
+		"INSERT INTO users (id, name) VALUES (2, 'b');",
+		"DELETE FROM users WHERE id = 1;",
+		"INSERT INTO users (id, name) VALUES (3, 'c');",
+		"INSERT INTO orders (id) VALUES (10);",
+	}
+	var gotIndividual []string
+	for _, stmt := range a.individual() {
+		gotIndividual = append(gotIndividual, stmt.sql)
+	}
+	if !reflect.DeepEqual(gotIndividual, wantIndividual) {
+		t.Errorf("individual() = %q, want %q", gotIndividual, wantIndividual)
+	}
+}
+
+func TestApplier_DifferentColumnsAreNotCoalesced(t *testing.T) {
+	a := NewApplier(nil, nil)
+	a.AddInsert("users", "INSERT INTO users (id, name) VALUES ", "(1, 'a')")
+	a.AddInsert("users", "INSERT INTO users (id) VALUES ", "(2)")
+
+	want := "INSERT INTO users (id, name) VALUES (1, 'a');\nINSERT INTO users (id) VALUES (2);"
+	if got := a.batchSQL(); got != want {
+		t.Errorf("batchSQL() = %q, want %q", got, want)
+	}
+}
+
+func TestApplier_Size(t *testing.T) {
+	a := NewApplier(nil, nil)
+	a.AddInsert("users", "INSERT INTO users (id) VALUES ", "(1)")
+	a.AddInsert("users", "INSERT INTO users (id) VALUES ", "(2)")
+	a.Add("DELETE FROM users WHERE id = 1;")
+
+	// Everything in the batch except the newline separating the two statements
+	if got, want := a.Size(), len(a.batchSQL())-1; got != want {
+		t.Errorf("Size() = %d, want %d", got, want)
+	}
+}
+
+func TestApplier_InsertRun(t *testing.T) {
+	a := NewApplier(nil, nil)
+	if a.InsertRun() {
+		t.Error("InsertRun() should be false with nothing queued")
+	}
+
+	a.AddInsert("users", "INSERT INTO users (id) VALUES ", "(1)")
+	a.AddInsert("users", "INSERT INTO users (id) VALUES ", "(2)")
+	if !a.InsertRun() {
+		t.Error("InsertRun() should be true for one coalesced INSERT")
+	}
+
+	a.AddInsert("orders", "INSERT INTO orders (id) VALUES ", "(1)")
+	if a.InsertRun() {
+		t.Error("InsertRun() should be false once a second table is queued")
+	}
+
+	b := NewApplier(nil, nil)
+	for i := 0; i < maxRowsPerInsert; i++ {
+		b.AddInsert("users", "INSERT INTO users (id) VALUES ", "(1)")
+	}
+	if b.InsertRun() {
+		t.Error("InsertRun() should be false once the INSERT holds a full page of rows")
+	}
+}
+
+func TestApplier_PagesLongInserts(t *testing.T) {
+	a := NewApplier(nil, nil)
+	for i := 0; i < maxRowsPerInsert+1; i++ {
+		a.AddInsert("users", "INSERT INTO users (id) VALUES ", "(1)")
+	}
+
+	if got := len(a.pending); got != 2 {
+		t.Fatalf("pending statements = %d, want 2", got)
+	}
+	if got := len(a.pending[0].rows); got != maxRowsPerInsert {
+		t.Errorf("first statement rows = %d, want %d", got, maxRowsPerInsert)
+	}
+	if got := len(a.pending[1].rows); got != 1 {
+		t.Errorf("second statement rows = %d, want 1", got)
+	}
+}
+
+// fakeConn records every statement and transaction boundary it sees, and
+// fails any statement containing failOn
+type fakeConn struct {
+	log    *[]string
+	failOn string
+}
+
+func (c *fakeConn) Prepare(query string) (driver.Stmt, error) {
+	return nil, errors.New("not implemented")
+}
+
+func (c *fakeConn) Close() error {
+	return nil
+}
+
+func (c *fakeConn) Begin() (driver.Tx, error) {
+	*c.log = append(*c.log, "BEGIN")
+	return &fakeTx{log: c.log}, nil
+}
+
+func (c *fakeConn) ExecContext(ctx context.Context, query string, args []driver.NamedValue) (driver.Result, error) {
+	*c.log = append(*c.log, query)
+	if c.failOn != "" && strings.Contains(query, c.failOn) {
+		return nil, errors.New("exec failed")
+	}
+	return driver.RowsAffected(1), nil
+}
+
+type fakeTx struct {
+	log *[]string
+}
+
+func (t *fakeTx) Commit() error {
+	*t.log = append(*t.log, "COMMIT")
+	return nil
+}
+
+func (t *fakeTx) Rollback() error {
+	*t.log = append(*t.log, "ROLLBACK")
+	return nil
+}
+
+type fakeConnector struct {
+	conn *fakeConn
+}
+
+func (c *fakeConnector) Connect(ctx context.Context) (driver.Conn, error) {
+	return c.conn, nil
+}
+
+func (c *fakeConnector) Driver() driver.Driver {
+	return nil
+}
+
+// newFakeDB returns a database whose connection records executed SQL in log
+func newFakeDB(log *[]string, failOn string) *dbsql.DB {
+	return dbsql.OpenDB(&fakeConnector{conn: &fakeConn{log: log, failOn: failOn}})
+}
+
+func TestApplier_FlushBatchInTransaction(t *testing.T) {
+	var log []string
+	a := NewApplier(newFakeDB(&log, ""), nil)
+	a.Add("DELETE FROM users WHERE id = 1;")
+	a.AddInsert("users", "INSERT INTO users (id) VALUES ", "(2)")
+
+	if failed := a.Flush(context.Background()); failed != 0 {
+		t.Errorf("Flush() failed = %d, want 0", failed)
+	}
+
+	want := []string{
+		"BEGIN",
+		"DELETE FROM users WHERE id = 1;\nINSERT INTO users (id) VALUES (2);",
+		"COMMIT",
+	}
+	if !reflect.DeepEqual(log, want) {
+		t.Errorf("executed %q, want %q", log, want)
+	}
+	if a.Len() != 0 {
+		t.Errorf("Len() after Flush = %d, want 0", a.Len())
+	}
+}
+
+func TestApplier_FlushFailedBatchReplaysIndividually(t *testing.T) {
+	var log []string
+	a := NewApplier(newFakeDB(&log, "bad"), nil)
+	a.Add("DELETE FROM users WHERE id = 1;")
+	a.AddInsert("users", "INSERT INTO users (id) VALUES ", "(2)")
+	a.AddInsert("users", "INSERT INTO users (id) VALUES ", "('bad')")
+
+	if failed := a.Flush(context.Background()); failed != 1 {
+		t.Errorf("Flush() failed = %d, want 1", failed)
+	}
+
+	want := []string{
+		"BEGIN",
+		"DELETE FROM users WHERE id = 1;\nINSERT INTO users (id) VALUES (2), ('bad');",
+		"ROLLBACK",
+		"DELETE FROM users WHERE id = 1;",
+		"INSERT INTO users (id) VALUES (2);",
+		"INSERT INTO users (id) VALUES ('bad');",
+	}
+	if !reflect.DeepEqual(log, want) {
+		t.Errorf("executed %q, want %q", log, want)
+	}
+}
+
+func TestApplier_FlushSingleInsertWithoutTransaction(t *testing.T) {
+	var log []string
+	a := NewApplier(newFakeDB(&log, ""), nil)
+	a.AddInsert("users", "INSERT INTO users (id) VALUES ", "(1)")
+	a.AddInsert("users", "INSERT INTO users (id) VALUES ", "(2)")
+
+	if failed := a.Flush(context.Background()); failed != 0 {
+		t.Errorf("Flush() failed = %d, want 0", failed)
+	}
+
+	want := []string{"INSERT INTO users (id) VALUES (1), (2);"}
+	if !reflect.DeepEqual(log, want) {
+		t.Errorf("executed %q, want %q", log, want)
+	}
+}
+
+func TestApplier_FlushSingleStatementFailure(t *testing.T) {
+	var log []string
+	a := NewApplier(newFakeDB(&log, "bad"), nil)
+	a.Add("DELETE FROM bad;")
+
+	if failed := a.Flush(context.Background()); failed != 1 {
+		t.Errorf("Flush() failed = %d, want 1", failed)
+	}
+	if want := []string{"DELETE FROM bad;"}; !reflect.DeepEqual(log, want) {
+		t.Errorf("executed %q, want %q", log, want)
+	}
+}
+
+func TestApplier_ReportsInsertedTablesAfterCommit(t *testing.T) {
+	var log []string
+	a := NewApplier(newFakeDB(&log, ""), func(table string) {
+		log = append(log, "inserted "+table)
+	})
+	a.AddInsert("users", "INSERT INTO users (id) VALUES ", "(1)")
+	a.Add("DELETE FROM orders WHERE id = 1;")
+
+	if len(log) != 0 {
+		t.Fatalf("tables reported before Flush: %q", log)
+	}
+	a.Flush(context.Background())
+
+	want := []string{
+		"BEGIN",
+		"INSERT INTO users (id) VALUES (1);\nDELETE FROM orders WHERE id = 1;",
+		"COMMIT",
+		"inserted users",
+	}
+	if !reflect.DeepEqual(log, want) {
+		t.Errorf("executed %q, want %q", log, want)
+	}
+}
+
+func TestApplier_ReportsOnlyInsertsThatSucceed(t *testing.T) {
+	var log []string
+	var inserted []string
+	a := NewApplier(newFakeDB(&log, "bad"), func(table string) {
+		inserted = append(inserted, table)
+	})
+	a.AddInsert("users", "INSERT INTO users (id) VALUES ", "(1)")
+	a.AddInsert("orders", "INSERT INTO orders (id) VALUES ", "('bad')")
+
+	if failed := a.Flush(context.Background()); failed != 1 {
+		t.Errorf("Flush() failed = %d, want 1", failed)
+	}
+	if want := []string{"users"}; !reflect.DeepEqual(inserted, want) {
+		t.Errorf("inserted tables = %q, want %q", inserted, want)
+	}
+}
@@ -0,0 +1,54 @@
+package apply
+
+// Progress tracks how far the change stream has been applied, so a reconnect
+// resumes without skipping or repeating changes.
+//
+// The stream resumes after a position (exclusively), but several changes can
+// share one: every row of a MySQL rows event has the same position. Resuming
+// after the last applied position would skip the rest of a partly applied
+// group, so Progress instead remembers the position before the group and how
+// many of the group's changes were applied, to be skipped on reconnect.
+type Progress struct {
+	start    string // position before the current group; empty if unknown
+	position string // position of the last change applied
+	applied  int    // changes applied at position
+}
+
+// Started records the position a stream was requested from. It is only the
+// resume point while nothing has been applied yet.
+func (p *Progress) Started(position string) {
+	if p.position == "" {
+		p.start = position
+	}
+}
+
+// Applied records that the change at position has been applied
+func (p *Progress) Applied(position string) {
+	if position == "" {
+		return
+	}
+	if position == p.position {
+		p.applied++
+		return
+	}
+	if p.position != "" {
+		p.start = p.position
+	}
+	p.position = position
+	p.applied = 1
+}
+
+// Resume returns the position to stream from and how many of the changes
+// that follow it have already been applied. The position is empty if nothing
+// has been applied yet.
+func (p *Progress) Resume() (position string, skip int) {
+	if p.position == "" {
+		return "", 0
+	}
+	if p.start == "" {
+		// Only new changes were requested, so there is no position before the
+		// first group to resume from; continue after it
+		return p.position, 0
+	}
+	return p.start, p.applied
+}
@@ -0,0 +1,54 @@
+package apply
+
+import "testing"
+
+func TestProgress_Resume(t *testing.T) {
+	tests := []struct {
+		name         string
+		started      string
+		applied      []string
+		wantPosition string
+		wantSkip     int
+	}{
+		{name: "nothing applied", started: "bootstrap", wantPosition: "", wantSkip: 0},
+		{name: "first group from bootstrap", started: "bootstrap", applied: []string{"0/100", "0/100"}, wantPosition: "bootstrap", wantSkip: 2},
+		{name: "distinct positions", started: "0/50", applied: []string{"0/100", "0/200"}, wantPosition: "0/100", wantSkip: 1},
+		{name: "stream broke mid-group", started: "0/50", applied: []string{"0/100", "0/200", "0/200", "0/200"}, wantPosition: "0/100", wantSkip: 3},
+		{name: "only new changes requested", started: "", applied: []string{"0/100", "0/100"}, wantPosition: "0/100", wantSkip: 0},
+		{name: "only new changes, later group", started: "", applied: []string{"0/100", "0/200", "0/200"}, wantPosition: "0/100", wantSkip: 2},
+		{name: "empty positions are ignored", started: "0/50", applied: []string{"0/100", ""}, wantPosition: "0/50", wantSkip: 1},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var p Progress
+			p.Started(tt.started)
+			for _, position := range tt.applied {
+				p.Applied(position)
+			}
+
+			position, skip := p.Resume()
+			if position != tt.wantPosition || skip != tt.wantSkip {
+				t.Errorf("Resume() = (%q, %d), want (%q, %d)", position, skip, tt.wantPosition, tt.wantSkip)
+			}
+		})
+	}
+}
+
+func TestProgress_StartedAfterApplyIsIgnored(t *testing.T) {
+	var p Progress
+	p.Started("0/50")
+	p.Applied("0/100")
+	p.Applied("0/100")
+
+	// Reconnecting restarts the stream from the resume position, and the
+	// skipped changes are not applied again
+	position, _ := p.Resume()
+	p.Started(position)
+
+	p.Applied("0/100")
+	position, skip := p.Resume()
+	if position != "0/50" || skip != 3 {
+		t.Errorf("Resume() = (%q, %d), want (%q, %d)", position, skip, "0/50", 3)
+	}
+}
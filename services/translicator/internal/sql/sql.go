@@ -2,20 +2,58 @@ package sql
 
 import (
 	"fmt"
+	"slices"
 	"strings"
 
 	"kasho/pkg/dialect"
 	"kasho/proto"
 )
 
-// SQLGenerator generates SQL statements using a specific dialect
+// SQLGenerator generates SQL statements using a specific dialect.
+// It caches statement shapes and is not safe for concurrent use.
 type SQLGenerator struct {
-	dialect dialect.Dialect
+	dialect     dialect.Dialect
+	insertHeads map[string]insertShape
+	tables      map[string]string // quoted table names
+}
+
+// insertShape is the cached INSERT head for the last column list seen on a table
+type insertShape struct {
+	columns []string
+	head    string
 }
 
 // NewSQLGenerator creates a new SQL generator with the specified dialect
 func NewSQLGenerator(d dialect.Dialect) *SQLGenerator {
-	return &SQLGenerator{dialect: d}
+	return &SQLGenerator{
+		dialect:     d,
+		insertHeads: make(map[string]insertShape),
+		tables:      make(map[string]string),
+	}
+}
+
+// ResetCache drops all cached statement shapes. Call it after applying DDL,
+// since a schema change can alter how a table's statements are built.
+func (g *SQLGenerator) ResetCache() {
+	clear(g.insertHeads)
+	clear(g.tables)
+}
+
+// quoteTable quotes a "schema.table" or bare table name with the dialect's
+// identifier quoting, quoting each part separately
+func (g *SQLGenerator) quoteTable(table string) string {
+	if quoted, ok := g.tables[table]; ok {
+		return quoted
+	}
+
+	var quoted string
+	if schema, name, ok := strings.Cut(table, "."); ok {
+		quoted = g.dialect.QuoteIdentifier(schema) + "." + g.dialect.QuoteIdentifier(name)
+	} else {
+		quoted = g.dialect.QuoteIdentifier(table)
+	}
+	g.tables[table] = quoted
+	return quoted
 }
 
 // ToSQL converts a Change into a SQL statement
@@ -46,21 +84,47 @@ func (g *SQLGenerator) toDMLSQL(dml *proto.DMLData) (string, error) {
 
 // toInsertSQL generates an INSERT SQL statement
 func (g *SQLGenerator) toInsertSQL(dml *proto.DMLData) (string, error) {
+	head, row, err := g.ToInsertParts(dml)
+	if err != nil {
+		return "", err
+	}
+	return head + row + ";", nil
+}
+
+// ToInsertParts splits the INSERT for an insert DML into its statement head
+// ("INSERT INTO "users" ("name", "email") VALUES ") and row tuple ("('a', 'b')"),
+// so consecutive rows sharing a head can be written as one multi-row INSERT
+func (g *SQLGenerator) ToInsertParts(dml *proto.DMLData) (string, string, error) {
 	if len(dml.ColumnNames) != len(dml.ColumnValues) {
-		return "", fmt.Errorf("mismatched column names and values: %d names, %d values", len(dml.ColumnNames), len(dml.ColumnValues))
+		return "", "", fmt.Errorf("mismatched column names and values: %d names, %d values", len(dml.ColumnNames), len(dml.ColumnValues))
 	}
 
-	columns := strings.Join(dml.ColumnNames, ", ")
 	values := make([]string, len(dml.ColumnValues))
 	for i, v := range dml.ColumnValues {
 		formatted, err := g.dialect.FormatValue(v)
 		if err != nil {
-			return "", fmt.Errorf("error formatting value for column %s: %w", dml.ColumnNames[i], err)
+			return "", "", fmt.Errorf("error formatting value for column %s: %w", dml.ColumnNames[i], err)
 		}
 		values[i] = formatted
 	}
 
-	return fmt.Sprintf("INSERT INTO %s (%s) VALUES (%s);", dml.Table, columns, strings.Join(values, ", ")), nil
+	return g.insertHead(dml.Table, dml.ColumnNames), "(" + strings.Join(values, ", ") + ")", nil
+}
+
+// insertHead returns the INSERT head for a table and column list, building it
+// only when the table's shape differs from the last one seen
+func (g *SQLGenerator) insertHead(table string, columns []string) string {
+	if shape, ok := g.insertHeads[table]; ok && slices.Equal(shape.columns, columns) {
+		return shape.head
+	}
+
+	quoted := make([]string, len(columns))
+	for i, col := range columns {
+		quoted[i] = g.dialect.QuoteIdentifier(col)
+	}
+	head := "INSERT INTO " + g.quoteTable(table) + " (" + strings.Join(quoted, ", ") + ") VALUES "
+	g.insertHeads[table] = insertShape{columns: slices.Clone(columns), head: head}
+	return head
 }
 
 // toUpdateSQL generates an UPDATE SQL statement
@@ -73,6 +137,10 @@ func (g *SQLGenerator) toUpdateSQL(dml *proto.DMLData) (string, error) {
 		return "", fmt.Errorf("update requires old keys")
 	}
 
+	if len(dml.ColumnNames) == 0 {
+		return "", fmt.Errorf("update has no columns to set")
+	}
+
 	// Build SET clause
 	setClauses := make([]string, len(dml.ColumnNames))
 	for i, col := range dml.ColumnNames {
@@ -80,7 +148,7 @@ func (g *SQLGenerator) toUpdateSQL(dml *proto.DMLData) (string, error) {
 		if err != nil {
 			return "", fmt.Errorf("error formatting value for column %s: %w", col, err)
 		}
-		setClauses[i] = fmt.Sprintf("%s = %s", col, formatted)
+		setClauses[i] = g.dialect.QuoteIdentifier(col) + " = " + formatted
 	}
 
 	// Build WHERE clause
@@ -90,11 +158,11 @@ func (g *SQLGenerator) toUpdateSQL(dml *proto.DMLData) (string, error) {
 		if err != nil {
 			return "", fmt.Errorf("error formatting value for key %s: %w", key, err)
 		}
-		whereClauses[i] = fmt.Sprintf("%s = %s", key, formatted)
+		whereClauses[i] = g.dialect.QuoteIdentifier(key) + " = " + formatted
 	}
 
 	return fmt.Sprintf("UPDATE %s SET %s WHERE %s;",
-		dml.Table,
+		g.quoteTable(dml.Table),
 		strings.Join(setClauses, ", "),
 		strings.Join(whereClauses, " AND ")), nil
 }
@@ -111,11 +179,11 @@ func (g *SQLGenerator) toDeleteSQL(dml *proto.DMLData) (string, error) {
 		if err != nil {
 			return "", fmt.Errorf("error formatting value for key %s: %w", key, err)
 		}
-		whereClauses[i] = fmt.Sprintf("%s = %s", key, formatted)
+		whereClauses[i] = g.dialect.QuoteIdentifier(key) + " = " + formatted
 	}
 
 	return fmt.Sprintf("DELETE FROM %s WHERE %s;",
-		dml.Table,
+		g.quoteTable(dml.Table),
 		strings.Join(whereClauses, " AND ")), nil
 }
 
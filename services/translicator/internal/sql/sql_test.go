@@ -3,6 +3,7 @@ package sql
 import (
 	"testing"
 
+	"kasho/pkg/dialect"
 	"kasho/proto"
 )
 
@@ -28,7 +29,7 @@ func TestToSQL(t *testing.T) {
 					},
 				},
 			},
-			wantSQL: "INSERT INTO users (name, email) VALUES ('John Doe', 'john@example.com');",
+			wantSQL: `INSERT INTO "users" ("name", "email") VALUES ('John Doe', 'john@example.com');`,
 			wantErr: false,
 		},
 		{
@@ -52,7 +53,7 @@ func TestToSQL(t *testing.T) {
 					},
 				},
 			},
-			wantSQL: "UPDATE users SET name = 'John Doe', email = 'john@example.com' WHERE id = 1;",
+			wantSQL: `UPDATE "users" SET "name" = 'John Doe', "email" = 'john@example.com' WHERE "id" = 1;`,
 			wantErr: false,
 		},
 		{
@@ -71,7 +72,7 @@ func TestToSQL(t *testing.T) {
 					},
 				},
 			},
-			wantSQL: "DELETE FROM users WHERE id = 1;",
+			wantSQL: `DELETE FROM "users" WHERE "id" = 1;`,
 			wantErr: false,
 		},
 		{
@@ -131,6 +132,24 @@ func TestToSQL(t *testing.T) {
 			},
 			wantErr: true,
 		},
+		{
+			name: "update without columns to set",
+			change: &proto.Change{
+				Data: &proto.Change_Dml{
+					Dml: &proto.DMLData{
+						Table: "users",
+						Kind:  "update",
+						OldKeys: &proto.OldKeys{
+							KeyNames: []string{"id"},
+							KeyValues: []*proto.ColumnValue{
+								{Value: &proto.ColumnValue_IntValue{IntValue: 1}},
+							},
+						},
+					},
+				},
+			},
+			wantErr: true,
+		},
 		{
 			name: "delete without old keys",
 			change: &proto.Change{
@@ -158,7 +177,7 @@ func TestToSQL(t *testing.T) {
 					},
 				},
 			},
-			wantSQL: "INSERT INTO users (name, email) VALUES ('John Doe', NULL);",
+			wantSQL: `INSERT INTO "users" ("name", "email") VALUES ('John Doe', NULL);`,
 			wantErr: false,
 		},
 		{
@@ -176,7 +195,7 @@ func TestToSQL(t *testing.T) {
 					},
 				},
 			},
-			wantSQL: "INSERT INTO users (name, age) VALUES ('John Doe', 42);",
+			wantSQL: `INSERT INTO "users" ("name", "age") VALUES ('John Doe', 42);`,
 			wantErr: false,
 		},
 		{
@@ -194,7 +213,7 @@ func TestToSQL(t *testing.T) {
 					},
 				},
 			},
-			wantSQL: "INSERT INTO users (name, is_active) VALUES ('John Doe', true);",
+			wantSQL: `INSERT INTO "users" ("name", "is_active") VALUES ('John Doe', true);`,
 			wantErr: false,
 		},
 		{
@@ -212,7 +231,7 @@ func TestToSQL(t *testing.T) {
 					},
 				},
 			},
-			wantSQL: "INSERT INTO users (name, created_at) VALUES ('John Doe', '2024-03-20 15:04:05');",
+			wantSQL: `INSERT INTO "users" ("name", "created_at") VALUES ('John Doe', '2024-03-20 15:04:05');`,
 			wantErr: false,
 		},
 		{
@@ -230,7 +249,7 @@ func TestToSQL(t *testing.T) {
 					},
 				},
 			},
-			wantSQL: "INSERT INTO users (name, birth_date) VALUES ('John Doe', '2024-03-20');",
+			wantSQL: `INSERT INTO "users" ("name", "birth_date") VALUES ('John Doe', '2024-03-20');`,
 			wantErr: false,
 		},
 		{
@@ -289,7 +308,7 @@ func TestToSQL_ComplexScenarios(t *testing.T) {
 					},
 				},
 			},
-			wantSQL: "UPDATE user_roles SET role_name = 'admin', permissions = 'read,write,delete' WHERE user_id = 123 AND org_id = 456;",
+			wantSQL: `UPDATE "user_roles" SET "role_name" = 'admin', "permissions" = 'read,write,delete' WHERE "user_id" = 123 AND "org_id" = 456;`,
 			wantErr: false,
 		},
 		{
@@ -307,7 +326,7 @@ func TestToSQL_ComplexScenarios(t *testing.T) {
 					},
 				},
 			},
-			wantSQL: "INSERT INTO users (name, bio) VALUES ('O''Connor', 'He said ''Hello World''');",
+			wantSQL: `INSERT INTO "users" ("name", "bio") VALUES ('O''Connor', 'He said ''Hello World''');`,
 			wantErr: false,
 		},
 		{
@@ -340,3 +359,112 @@ func TestToSQL_ComplexScenarios(t *testing.T) {
 		})
 	}
 }
+
+func TestToInsertParts(t *testing.T) {
+	g := NewSQLGenerator(dialect.NewPostgreSQL())
+
+	first := &proto.DMLData{
+		Table:       "users",
+		ColumnNames: []string{"id", "name"},
+		ColumnValues: []*proto.ColumnValue{
+			{Value: &proto.ColumnValue_IntValue{IntValue: 1}},
+			{Value: &proto.ColumnValue_StringValue{StringValue: "O'Connor"}},
+		},
+		Kind: "insert",
+	}
+	second := &proto.DMLData{
+		Table:       "users",
+		ColumnNames: []string{"id", "name"},
+		ColumnValues: []*proto.ColumnValue{
+			{Value: &proto.ColumnValue_IntValue{IntValue: 2}},
+			{Value: nil},
+		},
+		Kind: "insert",
+	}
+
+	head1, row1, err := g.ToInsertParts(first)
+	if err != nil {
+		t.Fatalf("ToInsertParts() error = %v", err)
+	}
+	head2, row2, err := g.ToInsertParts(second)
+	if err != nil {
+		t.Fatalf("ToInsertParts() error = %v", err)
+	}
+
+	if head1 != `INSERT INTO "users" ("id", "name") VALUES ` {
+		t.Errorf("ToInsertParts() head = %q", head1)
+	}
+	if head1 != head2 {
+		t.Errorf("rows with the same table and columns should share a head: %q != %q", head1, head2)
+	}
+	if row1 != "(1, 'O''Connor')" {
+		t.Errorf("ToInsertParts() row = %q", row1)
+	}
+	if row2 != "(2, NULL)" {
+		t.Errorf("ToInsertParts() row = %q", row2)
+	}
+
+	_, _, err = g.ToInsertParts(&proto.DMLData{
+		Table:       "users",
+		ColumnNames: []string{"id"},
+		Kind:        "insert",
+	})
+	if err == nil {
+		t.Error("ToInsertParts() expected error for mismatched columns and values")
+	}
+}
+
+func TestInsertHeadCache(t *testing.T) {
+	g := NewSQLGenerator(dialect.NewPostgreSQL())
+
+	if got := g.insertHead("users", []string{"id", "name"}); got != `INSERT INTO "users" ("id", "name") VALUES ` {
+		t.Errorf("insertHead() = %q", got)
+	}
+	if _, ok := g.insertHeads["users"]; !ok {
+		t.Fatal("insertHead() should cache the shape for the table")
+	}
+
+	// A different column list on the same table replaces the cached shape
+	if got := g.insertHead("users", []string{"id"}); got != `INSERT INTO "users" ("id") VALUES ` {
+		t.Errorf("insertHead() = %q", got)
+	}
+	if got := g.insertHeads["users"].columns; len(got) != 1 || got[0] != "id" {
+		t.Errorf("cached columns = %v, want [id]", got)
+	}
+
+	// The cache keeps its own copy of the column names
+	columns := []string{"id", "email"}
+	g.insertHead("accounts", columns)
+	columns[1] = "changed"
+	if got := g.insertHead("accounts", []string{"id", "email"}); got != `INSERT INTO "accounts" ("id", "email") VALUES ` {
+		t.Errorf("insertHead() = %q", got)
+	}
+
+	g.ResetCache()
+	if len(g.insertHeads) != 0 {
+		t.Errorf("ResetCache() left %d cached shapes", len(g.insertHeads))
+	}
+}
+
+func TestQuoteTable(t *testing.T) {
+	tests := []struct {
+		name    string
+		dialect dialect.Dialect
+		table   string
+		want    string
+	}{
+		{name: "postgres bare table", dialect: dialect.NewPostgreSQL(), table: "users", want: `"users"`},
+		{name: "postgres schema-qualified", dialect: dialect.NewPostgreSQL(), table: "public.users", want: `"public"."users"`},
+		{name: "postgres reserved word", dialect: dialect.NewPostgreSQL(), table: "public.order", want: `"public"."order"`},
+		{name: "mysql schema-qualified", dialect: dialect.NewMySQL(), table: "shop.orders", want: "`shop`.`orders`"},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			g := NewSQLGenerator(tt.dialect)
+			if got := g.quoteTable(tt.table); got != tt.want {
+				t.Errorf("quoteTable(%q) = %s, want %s", tt.table, got, tt.want)
+			}
+		})
+	}
+}